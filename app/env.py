@@ -8,4 +8,7 @@ load_dotenv()
 GCP_API_KEY = os.getenv("GCP_API_KEY")
 GCP_PROJECT_ID = os.getenv("GCP_PROJECT_ID")
 GCS_BUCKET_DATA = os.getenv("GCS_BUCKET_DATA")
-REGION = os.getenv("REGION")
\ No newline at end of file
+REGION = os.getenv("REGION")
+
+# Set SCRAPE_HUMANIZE=0 to skip simulated scrolling/mouse movement on About pages
+SCRAPE_HUMANIZE = os.getenv("SCRAPE_HUMANIZE", "1") != "0"
@@ -5,43 +5,70 @@
 Backfill Firestore channel docs for bots:
 - Fetch YouTube channel metadata (snippet, stats, etc.)
 - Save raw JSON to GCS
-- Ensure high-quality avatar is stored in GCS (PNG)
+- Ensure high-quality avatar is stored in GCS (as served, not re-encoded)
 - Update Firestore with avatar fields, metrics, screenshot, timestamps
 """
 
 import argparse
 import os
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-import cv2
-from google.cloud import firestore
 
-from app.utils.clients import get_youtube
-from app.utils.gcs_utils import write_json_to_gcs, upload_file_to_gcs
+from app.pipeline.channels.scraping import fetch_channel_items
+from app.utils.clients import get_firestore, get_thread_youtube
+from app.utils.firestore_utils import make_bulk_writer
+from app.utils.gcs_utils import write_json_to_gcs, upload_bytes_to_gcs
 from app.utils.paths import channel_metadata_raw_path
 from app.utils.image_processing import (
-    classify_avatar_url,
-    download_avatar,
+    IMAGE_EXTENSIONS,
+    classify_avatar_bytes,
+    decode_avatar,
+    download_image_bytes,
     upgrade_avatar_url,
 )
 from app.utils.logging import get_logger
 import re
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 HANDLE_RE = re.compile(r"^@?(?P<h>[-_.A-Za-z0-9]{2,64})$")
 
 logger = get_logger()
-db = firestore.Client()
+db = get_firestore()
 
 GCS_BUCKET_DATA = os.getenv("GCS_BUCKET_DATA")  # required by write_json_to_gcs
 
+# Channels backfilled concurrently (API calls, image downloads and GCS uploads)
+BACKFILL_WORKERS = 32
+
+# Fields collect_backfill_updates reads, so scans skip the rest of channel_data
+BACKFILL_FIELDS = [
+    "channel_data.snippet.thumbnails",
+    "channel_data.brandingSettings.image.bannerExternalUrl",
+    "avatar_url",
+    "avatar_gcs_uri",
+    "banner_gcs_uri",
+    "metrics",
+    "screenshot_gcs_uri",
+    "is_bot_set_at",
+    "registered_at",
+]
+
+# Shared pool for a channel's banner download+upload, overlapped with its avatar's.
+# Each backfill worker has at most one banner in flight, so one thread per
+# worker keeps banners from queueing behind each other.
+MEDIA_WORKERS = BACKFILL_WORKERS
+_MEDIA_POOL = ThreadPoolExecutor(max_workers=MEDIA_WORKERS)
+
 
 # ---------- helpers ----------
 
-def fetch_and_store_channel_metadata(channel_id: str):
-    """Fetch channel metadata from YouTube API, store raw JSON in GCS + Firestore."""
-    youtube = get_youtube()
+def fetch_and_store_channel_metadata(channel_id: str, *, write_doc: bool = True):
+    """Fetch channel metadata from YouTube API, store raw JSON in GCS + Firestore.
+
+    With write_doc=False the Firestore write is left to the caller.
+    """
+    youtube = get_thread_youtube()
     try:
         resp = youtube.channels().list(
             part="id,snippet,statistics,brandingSettings,topicDetails,status,contentDetails",
@@ -62,11 +89,12 @@ def fetch_and_store_channel_metadata(channel_id: str):
             write_json_to_gcs(GCS_BUCKET_DATA, channel_metadata_raw_path(channel_id), item)
 
         # Update Firestore with raw channel data
-        db.collection("channel").document(channel_id).set({
-            "channel_id": channel_id,
-            "channel_data": item,
-            "metadata_fetched_at": datetime.utcnow()
-        }, merge=True)
+        if write_doc:
+            db.collection("channel").document(channel_id).set({
+                "channel_id": channel_id,
+                "channel_data": item,
+                "metadata_fetched_at": datetime.utcnow()
+            }, merge=True)
 
         return item
     except Exception as e:
@@ -74,89 +102,73 @@ def fetch_and_store_channel_metadata(channel_id: str):
         return None
 
 
-def store_avatar_hq(channel_id: str, avatar_url: str) -> tuple[str | None, str | None, int | None]:
+def store_avatar_hq(channel_id: str, avatar_url: str):
     """
-    Download avatar at highest practical size, save PNG to GCS.
-    Returns (avatar_gcs_uri, avatar_url_used, size_px) or (None, None, None) on failure.
+    Download avatar at highest practical size and save it to GCS as served
+    (no decode/re-encode; extension follows the response Content-Type).
+    Returns (avatar_gcs_uri, avatar_url_used, size_px, (bytes, content_type)) so the
+    caller can reuse the download, or (None, None, None, None) on failure.
     """
     if not avatar_url:
-        return None, None, None
+        return None, None, None, None
 
     # Try descending sizes; first successful download wins
     candidate_sizes = [800, 512, 256]
     for size in candidate_sizes:
         try_url = upgrade_avatar_url(avatar_url, size=size)
-        img = download_avatar(try_url)
-        if img is None:
+        raw, content_type = download_image_bytes(try_url)
+        if raw is None:
             continue
 
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-            ok = cv2.imwrite(tmp.name, img, [cv2.IMWRITE_PNG_COMPRESSION, 3])
-            if not ok:
-                os.unlink(tmp.name)
-                continue
-
-            gcs_path = f"channel_avatars/{channel_id}_s{size}.png"
-            gcs_uri = upload_file_to_gcs(
-                GCS_BUCKET_DATA,   # bucket
-                gcs_path,          # remote path in GCS
-                tmp.name,          # local file to upload
-                content_type="image/png"
-            )
-
-        os.unlink(tmp.name)
+        gcs_path = f"channel_avatars/{channel_id}_s{size}{IMAGE_EXTENSIONS[content_type]}"
+        gcs_uri = upload_bytes_to_gcs(
+            GCS_BUCKET_DATA,   # bucket
+            gcs_path,          # remote path in GCS
+            raw,               # image bytes as served
+            content_type=content_type
+        )
+
         logger.info(f"🖼️ Saved HQ avatar → {gcs_uri}")
-        return gcs_uri, try_url, size
+        return gcs_uri, try_url, size, (raw, content_type)
 
-    # Fallback: try original URL
-    img = download_avatar(avatar_url)
+    # Fallback: try original URL (decoded only to learn its size)
+    raw, content_type = download_image_bytes(avatar_url)
+    img = decode_avatar(raw)
     if img is not None:
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-            ok = cv2.imwrite(tmp.name, img, [cv2.IMWRITE_PNG_COMPRESSION, 3])
-            if ok:
-                gcs_path = f"channel_avatars/{channel_id}_orig.png"
-                gcs_uri = upload_file_to_gcs(
-                    GCS_BUCKET_DATA,
-                    gcs_path,
-                    tmp.name,
-                    content_type="image/png"
-                )
-
-                os.unlink(tmp.name)
-                logger.info(f"🖼️ Saved fallback avatar → {gcs_uri}")
-                return gcs_uri, avatar_url, int(max(img.shape[:2]))
-        os.unlink(tmp.name)
+        gcs_path = f"channel_avatars/{channel_id}_orig{IMAGE_EXTENSIONS[content_type]}"
+        gcs_uri = upload_bytes_to_gcs(
+            GCS_BUCKET_DATA,
+            gcs_path,
+            raw,
+            content_type=content_type
+        )
+
+        logger.info(f"🖼️ Saved fallback avatar → {gcs_uri}")
+        return gcs_uri, avatar_url, int(max(img.shape[:2])), (raw, content_type)
 
     logger.warning(f"⚠️ Could not download avatar for {channel_id}")
-    return None, None, None
+    return None, None, None, None
 
 def store_banner(channel_id: str, banner_url: str) -> str | None:
     """
-    Download banner image and save PNG to GCS.
+    Download banner image and save it to GCS as served.
     Returns GCS URI or None.
     """
     if not banner_url:
         return None
     try:
-        img = download_avatar(banner_url)  # reuse your downloader
-        if img is None:
+        raw, content_type = download_image_bytes(banner_url)
+        if raw is None:
             return None
 
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-            ok = cv2.imwrite(tmp.name, img, [cv2.IMWRITE_PNG_COMPRESSION, 3])
-            if not ok:
-                os.unlink(tmp.name)
-                return None
-
-            gcs_path = f"channel_banners/{channel_id}.png"
-            gcs_uri = upload_file_to_gcs(
-                GCS_BUCKET_DATA,
-                gcs_path,
-                tmp.name,
-                content_type="image/png"
-            )
+        gcs_path = f"channel_banners/{channel_id}{IMAGE_EXTENSIONS[content_type]}"
+        gcs_uri = upload_bytes_to_gcs(
+            GCS_BUCKET_DATA,
+            gcs_path,
+            raw,
+            content_type=content_type
+        )
 
-        os.unlink(tmp.name)
         logger.info(f"🖼️ Saved banner → {gcs_uri}")
         return gcs_uri
     except Exception as e:
@@ -178,7 +190,7 @@ def fetch_channel_by_identifier(identifier: str) -> Optional[dict]:
     - Otherwise, use channels.list(forHandle=...) (fallback to search if needed)
     Returns the channel item dict, or None.
     """
-    youtube = get_youtube()
+    youtube = get_thread_youtube()
     try:
         if identifier.startswith("UC"):
             resp = youtube.channels().list(
@@ -220,48 +232,82 @@ def merge_scraped_fields(dest: dict, src: dict, keys=("screenshot_gcs_uri","avat
         if src.get(k) and k not in dest:
             dest[k] = src[k]
 
-def capture_screenshot(channel_id: str, avatar_url: str) -> str | None:
+def capture_screenshot(channel_id: str, avatar_url: str, image: tuple[bytes, str] | None = None) -> str | None:
     """
-    Save the avatar as a 'screenshot' (JPEG) in GCS.
+    Save the avatar as a 'screenshot' in GCS, as served.
+    Pass image=(bytes, content_type) to reuse an avatar already downloaded.
     """
     try:
-        img = download_avatar(avatar_url)
-        if img is None:
+        raw, content_type = image or download_image_bytes(avatar_url)
+        if raw is None:
             logger.warning(f"⚠️ Could not download avatar for {channel_id}")
             return None
 
-        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as tmp:
-            cv2.imwrite(tmp.name, img, [cv2.IMWRITE_JPEG_QUALITY, 90])
-            gcs_uri = upload_file_to_gcs(
-                GCS_BUCKET_DATA,
-                f"screenshots/{channel_id}.jpg",  # remote path
-                tmp.name,                         # local file
-                content_type="image/jpeg"
-            )
-
-        os.unlink(tmp.name)
+        gcs_uri = upload_bytes_to_gcs(
+            GCS_BUCKET_DATA,
+            f"screenshots/{channel_id}{IMAGE_EXTENSIONS[content_type]}",  # remote path
+            raw,                                                          # image bytes as served
+            content_type=content_type
+        )
         return gcs_uri
     except Exception as e:
         logger.error(f"❌ Failed to capture screenshot for {channel_id}: {e}")
         return None
 
-def fill_missing_metadata_in_channel(limit: int = 500):
-    q = db.collection("channel").where("channel_data", "==", None).limit(limit)
+def fill_missing_metadata_in_channel(limit: int = 500, workers: int = BACKFILL_WORKERS):
+    q = db.collection("channel").where("channel_data", "==", None).select(BACKFILL_FIELDS).limit(limit)
     docs = list(q.stream())
     logger.info(f"🔧 Found {len(docs)} channel docs missing metadata")
-    for snap in docs:
+    # UC ids are looked up 50 per call up front; handles and stragglers one by one
+    prefetched = fetch_channel_items(get_thread_youtube(), [snap.id for snap in docs])
+
+    def fill_one(snap) -> tuple[str, dict]:
         doc_id, doc = snap.id, snap.to_dict() or {}
-        item = fetch_channel_by_identifier(doc_id)
-        if not item: 
+        try:
+            if doc_id in prefetched:
+                item = prefetched[doc_id]
+            else:
+                item = fetch_channel_by_identifier(doc_id)
+            if not item:
+                return doc_id, {}
+            if GCS_BUCKET_DATA:
+                write_json_to_gcs(GCS_BUCKET_DATA, channel_metadata_raw_path(doc_id), item)
+            # Metadata and backfilled fields go out as one write
+            updates = {
+                "channel_id": doc_id,
+                "channel_data": item,
+                "metadata_fetched_at": datetime.utcnow()
+            }
+            updates.update(collect_backfill_updates(doc_id, {**doc, "channel_data": item}))
+            return doc_id, updates
+        except Exception as e:
+            logger.error(f"❌ Metadata fill failed for {doc_id}: {e}")
+            return doc_id, {}
+
+    writer = make_bulk_writer(db)
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            for doc_id, updates in pool.map(fill_one, docs):
+                apply_channel_updates(doc_id, updates, writer)
+    finally:
+        writer.close()
+
+
+def build_handle_index() -> Dict[str, str]:
+    """
+    Map lower-cased handles (customUrl without '@') to UC ids for every
+    canonical channel doc, using one scan that projects only customUrl.
+    """
+    index = {}
+    snaps = db.collection("channel").select(["channel_data.snippet.customUrl"]).stream()
+    for snap in snaps:
+        if not snap.id.startswith("UC"):
             continue
-        if GCS_BUCKET_DATA:
-            write_json_to_gcs(GCS_BUCKET_DATA, channel_metadata_raw_path(doc_id), item)
-        snap.reference.set({
-            "channel_id": doc_id,
-            "channel_data": item,
-            "metadata_fetched_at": datetime.utcnow()
-        }, merge=True)
-        backfill_channel(doc_id, {**doc, "channel_data": item})
+        channel_data = (snap.to_dict() or {}).get("channel_data") or {}
+        custom_url = channel_data.get("snippet", {}).get("customUrl")
+        if custom_url:
+            index[custom_url.lstrip("@").lower()] = snap.id
+    return index
 
 
 def migrate_collection_identifiers(collection_name: str, *, limit: int = 1000, force_avatars: bool = False):
@@ -269,18 +315,36 @@ def migrate_collection_identifiers(collection_name: str, *, limit: int = 1000, f
     Scan {collection_name} for docs whose id is a *handle* (not UC…),
     fetch channel by handle, then write a canonical channel doc under the UC id.
     Copies scraped fields, saves raw JSON, then calls backfill_channel(..).
+    Handles that already belong to a canonical channel doc are resolved from
+    a local customUrl index instead of the API, and their writes are batched.
     """
     col = db.collection(collection_name)
     docs = list(col.limit(limit).stream())
     logger.info(f"🔎 Scanning {collection_name} ({len(docs)}) for handle-ids…")
 
+    handle_docs = [snap for snap in docs if not snap.id.startswith("UC")]
+    handle_index = build_handle_index() if handle_docs else {}
+
+    writer = make_bulk_writer(db)
     promoted = 0
-    for snap in docs:
+    for snap in handle_docs:
         doc_id = snap.id
-        if doc_id.startswith("UC"):
-            continue  # already canonical
-
         doc = snap.to_dict() or {}
+
+        handle = normalize_handle(doc_id)
+        known_uc = handle_index.get(handle.lower()) if handle else None
+        if known_uc:
+            # Canonical doc already exists (and was backfilled when created):
+            # carry over scraped fields and mark the handle doc as migrated.
+            now = datetime.utcnow()
+            updates = {"last_checked_at": now}
+            merge_scraped_fields(updates, doc)
+            writer.set(db.collection("channel").document(known_uc), updates, merge=True)
+            writer.set(snap.reference, {"migrated_to": known_uc, "migrated_at": now}, merge=True)
+            logger.info(f"⬆️  Promoted {collection_name}/{doc_id} → channel/{known_uc} (indexed)")
+            promoted += 1
+            continue
+
         # 1) fetch by identifier (handle or UC)
         item = fetch_channel_by_identifier(doc_id)
         if not item:
@@ -302,27 +366,34 @@ def migrate_collection_identifiers(collection_name: str, *, limit: int = 1000, f
         }
         merge_scraped_fields(updates, doc)
 
-        db.collection("channel").document(uc_id).set(updates, merge=True)
-        logger.info(f"⬆️  Promoted {collection_name}/{doc_id} → channel/{uc_id}")
-
         # 3) run the usual backfill to ensure avatar HQ, metrics, screenshot, etc.
-        backfill_channel(uc_id, db.collection("channel").document(uc_id).get().to_dict(), force_avatars=force_avatars)
+        #    (on the canonical doc as it will look after the merge, written together)
+        channel_ref = db.collection("channel").document(uc_id)
+        existing = channel_ref.get().to_dict() or {}
+        updates.update(collect_backfill_updates(uc_id, {**existing, **updates}, force_avatars=force_avatars))
+        writer.set(channel_ref, updates, merge=True)
+        logger.info(f"⬆️  Promoted {collection_name}/{doc_id} → channel/{uc_id}")
 
         # 4) mark original doc as migrated (don’t delete automatically)
-        snap.reference.set({
+        writer.set(snap.reference, {
             "migrated_to": uc_id,
             "migrated_at": datetime.utcnow()
         }, merge=True)
 
         promoted += 1
 
+    writer.close()
     logger.info(f"✅ Migrated {promoted} doc(s) from {collection_name}")
 
 
 # ---------- main backfill ----------
 
-def backfill_channel(doc_id: str, doc: dict, *, force_avatars: bool = False):
-    """Fill missing fields for a bot channel (including high-quality avatar in GCS)."""
+def collect_backfill_updates(doc_id: str, doc: dict, *, force_avatars: bool = False) -> dict:
+    """
+    Compute the missing fields for a bot channel (storing HQ avatar, banner and
+    screenshot in GCS along the way) without writing the channel doc.
+    Returns the fields to merge into channel/{doc_id}, or {} if no metadata.
+    """
     logger.info(f"🔄 Backfilling {doc_id}...")
 
     updates = {}
@@ -331,9 +402,13 @@ def backfill_channel(doc_id: str, doc: dict, *, force_avatars: bool = False):
     # Step 1: fetch metadata if missing
     channel_data = doc.get("channel_data")
     if not channel_data:
-        channel_data = fetch_and_store_channel_metadata(doc_id)
+        channel_data = fetch_and_store_channel_metadata(doc_id, write_doc=False)
+        if channel_data:
+            updates["channel_id"] = doc_id
+            updates["channel_data"] = channel_data
+            updates["metadata_fetched_at"] = now
     if not channel_data:
-        return
+        return {}
 
     # Step 2: ensure avatar_url
     avatar_url = doc.get("avatar_url")
@@ -348,61 +423,107 @@ def backfill_channel(doc_id: str, doc: dict, *, force_avatars: bool = False):
         if avatar_url:
             updates["avatar_url"] = avatar_url
 
+    # Banner store runs on the media pool while the avatar is handled here
+    banner_url = channel_data.get("brandingSettings", {}).get("image", {}).get("bannerExternalUrl")
+    banner_future = None
+    if banner_url and not doc.get("banner_gcs_uri"):
+        banner_future = _MEDIA_POOL.submit(store_banner, doc_id, banner_url)
+
     # Step 3: ensure HQ avatar is stored to GCS (+ fields)
     need_hq = force_avatars or (not doc.get("avatar_gcs_uri"))
+    # (bytes, content_type) of the avatar, downloaded at most once per channel
+    avatar_image = None
     if avatar_url and need_hq:
-        avatar_gcs_uri, avatar_url_used, size_px = store_avatar_hq(doc_id, avatar_url)
+        avatar_gcs_uri, avatar_url_used, size_px, avatar_image = store_avatar_hq(doc_id, avatar_url)
         if avatar_gcs_uri:
             updates["avatar_gcs_uri"] = avatar_gcs_uri
             if avatar_url_used:
                 updates["avatar_url_hq"] = avatar_url_used
             if size_px:
                 updates["avatar_size_px"] = size_px
-    
-    banner_url = channel_data.get("brandingSettings", {}).get("image", {}).get("bannerExternalUrl")
-    if banner_url and not doc.get("banner_gcs_uri"):
-        gcs_uri = store_banner(doc_id, banner_url)
+
+    if banner_future is not None:
+        gcs_uri = banner_future.result()
         if gcs_uri:
             updates["banner_url"] = banner_url
             updates["banner_gcs_uri"] = gcs_uri
 
-    # Step 4: metrics (compute once; uses avatar_url; you can switch to avatar_url_hq if you prefer)
-    if (avatar_url or updates.get("avatar_url")) and not doc.get("metrics"):
+    # Steps 4-5 share one avatar download (reusing step 3's when there was one)
+    need_metrics = bool(avatar_url) and not doc.get("metrics")
+    need_shot = bool(avatar_url) and not doc.get("screenshot_gcs_uri")
+    avatar_src = updates.get("avatar_url_hq") or avatar_url
+    if (need_metrics or need_shot) and avatar_image is None:
+        raw, content_type = download_image_bytes(avatar_src)
+        if raw is not None:
+            avatar_image = (raw, content_type)
+
+    # Step 4: metrics (compute once, at the 256px the CDN would have served)
+    if need_metrics:
         try:
-            url_for_metrics = updates.get("avatar_url_hq") or avatar_url
-            print(url_for_metrics)
-            _, metrics = classify_avatar_url(url_for_metrics, size=256)
+            print(avatar_src)
+            _, metrics = classify_avatar_bytes([avatar_image[0] if avatar_image else None], max_size=256)[0]
             print(metrics)
             updates["metrics"] = metrics
         except Exception as e:
             logger.warning(f"⚠️ Could not compute metrics for {doc_id}: {e}")
 
     # Step 5: (Optional) legacy screenshot path populated from avatar
-    if (avatar_url or updates.get("avatar_url")) and not doc.get("screenshot_gcs_uri"):
-        url_for_shot = updates.get("avatar_url_hq") or avatar_url
-        gcs_uri = capture_screenshot(doc_id, url_for_shot)
-        if gcs_uri:
-            updates["screenshot_gcs_uri"] = gcs_uri
+    if need_shot:
+        if avatar_image is None:
+            logger.warning(f"⚠️ Could not download avatar for {doc_id}")
+        else:
+            gcs_uri = capture_screenshot(doc_id, avatar_src, image=avatar_image)
+            if gcs_uri:
+                updates["screenshot_gcs_uri"] = gcs_uri
 
     # Step 6: timestamps
     updates["is_bot_set_at"] = doc.get("is_bot_set_at", now)
     updates["last_checked_at"] = now
     updates["registered_at"] = doc.get("registered_at", now)
+    return updates
 
-    if updates:
-        db.collection("channel").document(doc_id).set(updates, merge=True)
-        logger.info(f"✅ Updated {doc_id} with {list(updates.keys())}")
-    else:
+
+def apply_channel_updates(doc_id: str, updates: dict, writer=None):
+    """Merge backfilled fields into channel/{doc_id} (through writer if given)."""
+    if not updates:
         logger.info(f"ℹ️ Nothing to update for {doc_id}")
+        return
+    doc_ref = db.collection("channel").document(doc_id)
+    if writer is not None:
+        writer.set(doc_ref, updates, merge=True)
+    else:
+        doc_ref.set(updates, merge=True)
+    logger.info(f"✅ Updated {doc_id} with {list(updates.keys())}")
+
+
+def backfill_channel(doc_id: str, doc: dict, *, force_avatars: bool = False):
+    """Fill missing fields for a bot channel (including high-quality avatar in GCS)."""
+    apply_channel_updates(doc_id, collect_backfill_updates(doc_id, doc, force_avatars=force_avatars))
 
 
-def backfill_all_bots(force_avatars: bool = False):
-    """Iterate over all bots in Firestore and backfill missing data."""
-    bots = db.collection("channel").where("is_bot", "==", True).stream()
-    for i, snap in enumerate(bots, 1):
-        backfill_channel(snap.id, snap.to_dict(), force_avatars=force_avatars)
-        if i % 20 == 0:
-            logger.info(f"⏳ Processed {i} bots...")
+def backfill_all_bots(force_avatars: bool = False, workers: int = BACKFILL_WORKERS):
+    """
+    Iterate over all bots in Firestore and backfill missing data.
+    Channels are backfilled on a thread pool; their writes go through one BulkWriter.
+    """
+    bots = db.collection("channel").where("is_bot", "==", True).select(BACKFILL_FIELDS).stream()
+
+    def backfill_one(snap) -> tuple[str, dict]:
+        try:
+            return snap.id, collect_backfill_updates(snap.id, snap.to_dict() or {}, force_avatars=force_avatars)
+        except Exception as e:
+            logger.error(f"❌ Backfill failed for {snap.id}: {e}")
+            return snap.id, {}
+
+    writer = make_bulk_writer(db)
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            for i, (doc_id, updates) in enumerate(pool.map(backfill_one, bots), 1):
+                apply_channel_updates(doc_id, updates, writer)
+                if i % 20 == 0:
+                    logger.info(f"⏳ Processed {i} bots...")
+    finally:
+        writer.close()
 
 
 if __name__ == "__main__":
@@ -414,6 +535,7 @@ if __name__ == "__main__":
     parser.add_argument("--migrate-handles", action="store_true", help="Promote handle-id docs in channel and channel_pending to canonical UC channel docs")
     parser.add_argument("--migrate-limit", type=int, default=1000, help="Max docs to scan per collection during migration")
     parser.add_argument("--fill-missing-meta", action="store_true", help="Fill channel_data for UC docs that lack it")
+    parser.add_argument("--workers", type=int, default=BACKFILL_WORKERS, help="Channels backfilled concurrently")
 
     args = parser.parse_args()
 
@@ -422,7 +544,7 @@ if __name__ == "__main__":
         migrate_collection_identifiers("channel_pending", limit=args.migrate_limit, force_avatars=args.force_avatars)
 
     if args.fill_missing_meta:
-        fill_missing_metadata_in_channel()
+        fill_missing_metadata_in_channel(workers=args.workers)
 
     if args.one:
         snap = db.collection("channel").document(args.one).get()
@@ -431,4 +553,4 @@ if __name__ == "__main__":
         else:
             logger.error(f"❌ Channel {args.one} not found in Firestore")
     else:
-        backfill_all_bots(force_avatars=args.force_avatars)
+        backfill_all_bots(force_avatars=args.force_avatars, workers=args.workers)
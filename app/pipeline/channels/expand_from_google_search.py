@@ -19,11 +19,10 @@ from datetime import datetime
 
 import requests
 from dotenv import load_dotenv
-from google.cloud import firestore
 from googleapiclient.errors import HttpError
 
 from app.pipeline.channels.scraping import expand_bot_graph_async, fetch_channel_item
-from app.utils.clients import get_youtube
+from app.utils.clients import get_firestore, get_youtube
 
 # Load environment variables from .env file
 load_dotenv()
@@ -38,7 +37,7 @@ LOGGER = logging.getLogger(__name__)
 GOOGLE_CSE_API_KEY = os.getenv("GOOGLE_CSE_API_KEY", "")
 GOOGLE_CSE_ID = os.getenv("GOOGLE_CSE_ID", "")
 
-db = firestore.Client()
+db = get_firestore()
 
 
 def fetch_bot_channels(
@@ -334,15 +333,19 @@ async def expand_bot_graph_from_search(
             try:
                 LOGGER.info(f"   🚀 Expanding graph for {len(valid_channels)} channels...")
 
-                # Store discovery metadata
+                # Store discovery metadata in one batch, committed off the loop
+                discoveries = db.batch()
+                discoveries_col = db.collection("channel_discoveries")
+                now = datetime.now()
                 for ch_id in valid_channels:
-                    db.collection("channel_discoveries").add({
+                    discoveries.set(discoveries_col.document(), {
                         "discovered_from_channel_id": channel_id,
                         "discovered_channel_id": ch_id,
                         "discovery_method": "google_custom_search",
-                        "discovered_at": datetime.now(),
+                        "discovered_at": now,
                         "is_validated": validate_channels,
                     })
+                await asyncio.to_thread(discoveries.commit)
 
                 # Expand the graph with "pending_review" status
                 await expand_bot_graph_async(
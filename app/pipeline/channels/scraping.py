@@ -12,33 +12,37 @@ This module provides functionality to:
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import random
 import re
-import tempfile
+import threading
+from collections import deque
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import List, Set, Tuple, Optional
-from urllib.parse import urlparse, unquote, parse_qs
+from functools import lru_cache
+from typing import AsyncIterator, Deque, Dict, List, Set, Tuple, Optional
+from urllib.parse import unquote
 
-import cv2
-import numpy as np
-import requests
-from google.cloud import firestore
+import httpx
+from google.cloud.firestore_v1.bulk_writer import BulkWriter
 from googleapiclient.errors import HttpError
-from playwright.async_api import async_playwright, Page
+from playwright.async_api import async_playwright, Page, Route, TimeoutError as PlaywrightTimeoutError
 
-from app.utils.clients import get_youtube
-from app.utils.gcs_utils import write_json_to_gcs, upload_png, upload_file_to_gcs
+from app.utils.clients import get_firestore, get_http_session, get_thread_youtube
+from app.utils.firestore_utils import make_bulk_writer
+from app.utils.gcs_utils import read_id_set, write_id_set, write_json_to_gcs, upload_jpeg, upload_bytes_to_gcs
 from app.utils.paths import (
     channel_metadata_raw_path,
     channel_sections_raw_path,
 )
-from app.utils.image_processing import classify_avatar_url
-from app.env import GCS_BUCKET_DATA
+from app.utils.image_processing import IMAGE_EXTENSIONS, classify_avatar_url, sniff_image_type
+from app.env import GCS_BUCKET_DATA, SCRAPE_HUMANIZE
 
 __all__ = [
     "PlaywrightContext",
+    "PagePool",
     "get_channel_url",
     "scrape_about_page",
     "expand_bot_graph_async",
@@ -47,12 +51,79 @@ __all__ = [
 LOGGER = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
 
-db = firestore.Client()
+db = get_firestore()
+
+# Number of channels expanded concurrently (one browser page each)
+DEFAULT_CONCURRENCY = 8
+
+# Gzipped newline-separated IDs of channel docs known to exist, carried across runs
+KNOWN_CHANNELS_BLOB = "manifests/expand_bot_graph/known_channel_ids.txt.gz"
+
+# Size component of YouTube avatar URLs (e.g. "=s88-c-k...")
+_AVATAR_SIZE_RE = re.compile(r"=s\d+-")
+
+# Avatars are stored at this size (px); the CDN resizes, and classification uses 128
+AVATAR_STORE_SIZE = 256
+
+# Any of these marks a rendered About page (matched as one CSS selector list).
+# Only About-specific nodes: the channel header renders before the About
+# content, so waiting on it would scrape an empty links section.
+ABOUT_READY_SELECTOR = ", ".join([
+    "ytd-about-channel-renderer",
+    "#link-list-container",
+    "ytd-channel-about-metadata-renderer",
+])
+
+# Channel tiles on About/Channels tabs
+CHANNEL_TILE_SELECTOR = "ytd-grid-channel-renderer a#channel-info, ytd-channel-renderer a.channel-link"
+
+# Evaluated in the page so a whole anchor list comes back in one CDP message
+_RAW_HREFS_JS = "els => els.map(e => e.getAttribute('href'))"
+_ABOUT_LINK_HREFS_JS = """els => els.map(e => {
+    const href = e.href;
+    if (href && href.includes('youtube.com/redirect')) {
+        return new URL(href).searchParams.get('q') || href;
+    }
+    return href;
+})"""
+# Avatar, banner and featured-channel hrefs read from a homepage in one round trip
+_HOME_BUNDLE_JS = """({tiles, limit}) => {
+    const src = sel => document.querySelector(sel)?.getAttribute('src') || null;
+    return {
+        avatar: src('img.ytCoreImageHost'),
+        banner: src('yt-image-banner-view-model img'),
+        featured: [...document.querySelectorAll(tiles)]
+            .slice(0, limit)
+            .map(a => a.getAttribute('href')),
+    };
+}"""
+
+# Homepage navigation only waits for DOMContentLoaded, for at most this long (ms);
+# on timeout the page is used as far as it rendered
+HOME_GOTO_TIMEOUT_MS = 10_000
+
+# Pooled pages are closed and replaced after this many checkouts, since a
+# page keeps accumulating JS heap and request records until it is closed
+PAGE_MAX_USES = 50
+
+# Resource types pooled pages don't download unless a scrape needs visuals
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+
+# Connection cap for the shared image-download HTTP client
+HTTP_MAX_CONNECTIONS = 64
+
+# Pre-answered cookie consent, so EU-routed loads don't render the consent wall
+CONSENT_COOKIES = [
+    {"name": "SOCS", "value": "CAI", "domain": ".youtube.com", "path": "/"},
+]
 
 CHANNEL_PARTS = (
     "id,snippet,statistics,brandingSettings,topicDetails,status,contentDetails"
 )
 
+# Max channel IDs per channels.list call (same quota cost as a single ID)
+CHANNELS_LIST_MAX_IDS = 50
+
 USER_AGENTS = [
     # Chrome (Windows / macOS / Linux)
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.6167.140 Safari/537.36",
@@ -90,14 +161,22 @@ class PlaywrightContext:
     """Async context manager for Playwright browser automation.
     
     Manages browser lifecycle with automatic crash recovery for Cloud Run.
-    Maintains a persistent browser context across multiple page operations.
+    Maintains one persistent browser context shared by every page (and so by
+    every concurrent worker); a new context is only created on crash.
     """
     
-    def __init__(self) -> None:
-        """Initialize the Playwright context manager."""
+    def __init__(self, max_pages: int = DEFAULT_CONCURRENCY) -> None:
+        """Initialize the Playwright context manager.
+        
+        Args:
+            max_pages: Maximum number of pages checked out of the page pool at once
+        """
         self.playwright = None
         self.browser = None
         self.context = None
+        self.pages = PagePool(self, max_pages)
+        self.http: Optional[httpx.AsyncClient] = None
+        self._relaunch_lock = asyncio.Lock()
 
     async def __aenter__(self) -> "PlaywrightContext":
         """Start Playwright and launch browser on context entry.
@@ -107,6 +186,12 @@ class PlaywrightContext:
         """
         self.playwright = await async_playwright().start()
         self.browser, self.context = await self._launch_browser()
+        # Shared keep-alive client for avatar/banner downloads
+        self.http = httpx.AsyncClient(
+            timeout=10,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS),
+        )
         return self
 
     async def _launch_browser(self) -> Tuple:
@@ -151,6 +236,7 @@ class PlaywrightContext:
             Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
             Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});
         }""")
+        await context.add_cookies(CONSENT_COOKIES)
         return browser, context
 
     async def new_page(self) -> Page:
@@ -163,20 +249,38 @@ class PlaywrightContext:
         """
         if not self.context:
             LOGGER.warning("⚠️ Browser context missing — relaunching")
-            self.browser, self.context = await self._launch_browser()
+            await self._relaunch(None)
 
+        context = self.context
         try:
-            page = await self.context.new_page()
-            page.set_default_navigation_timeout(90000)
-            page.set_default_timeout(30000)
-            return page
+            page = await context.new_page()
         except Exception as e:
             LOGGER.warning(f"⚠️ Browser crashed ({e}), relaunching")
-            self.browser, self.context = await self._launch_browser()
+            await self._relaunch(context)
             page = await self.context.new_page()
-            page.set_default_navigation_timeout(90000)
-            page.set_default_timeout(30000)
-            return page
+        page.set_default_navigation_timeout(90000)
+        page.set_default_timeout(30000)
+        return page
+
+    async def _relaunch(self, stale_context) -> None:
+        """Replace a crashed browser once, even if several workers hit the crash.
+        
+        Args:
+            stale_context: Context the caller saw fail; if it has already been
+                replaced by another worker, nothing is relaunched
+        """
+        async with self._relaunch_lock:
+            if self.context is not stale_context:
+                return
+            old_browser = self.browser
+            # Idle pooled pages belong to the dead context
+            self.pages.clear()
+            self.browser, self.context = await self._launch_browser()
+            if old_browser:
+                try:
+                    await old_browser.close()
+                except Exception:
+                    pass
 
     async def __aexit__(self, _exc_type, _exc, _tb) -> None:
         """Clean up browser and Playwright on context exit.
@@ -187,6 +291,8 @@ class PlaywrightContext:
             _tb: Exception traceback (if any) - unused
         """
         try:
+            if self.http:
+                await self.http.aclose()
             if self.context:
                 await self.context.close()
             if self.browser:
@@ -196,10 +302,110 @@ class PlaywrightContext:
                 await self.playwright.stop()
 
 
+class PagePool:
+    """Bounded pool of reusable pages on the shared browser context.
+    
+    Pages are handed out with ``async with pool.acquire() as page`` and
+    returned to the pool afterwards instead of being closed, so Chromium
+    target setup is paid once per page rather than once per scrape.
+    """
+
+    def __init__(self, owner: PlaywrightContext, size: int, max_uses: int = PAGE_MAX_USES) -> None:
+        """Initialize the pool.
+        
+        Args:
+            owner: PlaywrightContext used to open new pages
+            size: Maximum number of pages checked out at once
+            max_uses: Checkouts after which a page is closed instead of reused
+        """
+        self._owner = owner
+        self._semaphore = asyncio.Semaphore(max(1, size))
+        self._idle: Deque[Page] = deque()
+        self._uses: Dict[Page, int] = {}
+        self._max_uses = max_uses
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Page]:
+        """Check out a page, opening a new one if none is idle.
+        
+        Yields:
+            Playwright Page, returned to the pool on exit
+        """
+        async with self._semaphore:
+            page = await self._checkout()
+            try:
+                yield page
+            finally:
+                await self._release(page)
+
+    def clear(self) -> None:
+        """Forget idle pages (used when the browser is relaunched)."""
+        self._idle.clear()
+        self._uses.clear()
+
+    async def _checkout(self) -> Page:
+        """Pop a live idle page or open a new one."""
+        while self._idle:
+            page = self._idle.popleft()
+            if not page.is_closed():
+                return page
+            self._uses.pop(page, None)
+        page = await self._owner.new_page()
+        await page.route("**/*", _abort_heavy_resources)
+        return page
+
+    async def _release(self, page: Page) -> None:
+        """Reset a page and return it to the idle list (dropped if crashed or worn out)."""
+        uses = self._uses.pop(page, 0) + 1
+        if page.is_closed():
+            return
+        if uses >= self._max_uses:
+            LOGGER.debug(f"♻️ Recycling page after {uses} uses")
+            await self._discard(page)
+            return
+        try:
+            # Unload the previous document and drop accumulated timing entries
+            await page.goto("about:blank")
+            await page.evaluate("() => performance.clearResourceTimings()")
+        except Exception as e:
+            LOGGER.debug(f"⚠️ Dropping unusable page from pool: {e}")
+            await self._discard(page)
+            return
+        self._uses[page] = uses
+        self._idle.append(page)
+
+    async def _discard(self, page: Page) -> None:
+        """Close a page that is not going back into the pool."""
+        try:
+            await page.close()
+        except Exception:
+            pass
+
+
+async def _abort_heavy_resources(route: Route) -> None:
+    """Route handler that drops image/font/media/stylesheet requests."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+@asynccontextmanager
+async def allow_heavy_resources(page: Page) -> AsyncIterator[None]:
+    """Temporarily let a pooled page load every resource type (for screenshots)."""
+    await page.unroute("**/*", _abort_heavy_resources)
+    try:
+        yield
+    finally:
+        if not page.is_closed():
+            await page.route("**/*", _abort_heavy_resources)
+
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
 
+@lru_cache(maxsize=8192)
 def get_channel_url(identifier: str, tab: str = "") -> str:
     """Construct a YouTube channel URL from ID or handle.
     
@@ -237,19 +443,9 @@ def store_avatar_to_gcs(cid: str, channel_item: dict) -> Optional[str]:
         return None
 
     try:
-        resp = requests.get(avatar_url, timeout=10)
-        arr = np.frombuffer(resp.content, dtype=np.uint8)
-        img = cv2.imdecode(arr, cv2.IMREAD_COLOR)
-        if img is None:
-            return None
-
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-            cv2.imwrite(tmp.name, img, [cv2.IMWRITE_PNG_COMPRESSION, 3])
-            gcs_path = f"channel_avatars/{cid}.png"
-            gcs_uri = upload_file_to_gcs(
-                GCS_BUCKET_DATA, gcs_path, tmp.name, content_type="image/png"
-            )
-        return gcs_uri
+        resp = get_http_session().get(upgrade_avatar_url(avatar_url, AVATAR_STORE_SIZE), timeout=10)
+        # Stored as served (magic bytes checked) rather than decoded and re-encoded
+        return _store_image_bytes(f"channel_avatars/{cid}", resp.content)
     except Exception as e:
         LOGGER.warning(f"⚠️ Failed to save avatar for {cid}: {e}")
         return None
@@ -274,85 +470,136 @@ def store_banner_to_gcs(cid: str, channel_item: dict) -> Optional[str]:
         return None
 
     try:
-        resp = requests.get(banner_url, timeout=10)
-        arr = np.frombuffer(resp.content, dtype=np.uint8)
-        img = cv2.imdecode(arr, cv2.IMREAD_COLOR)
-        if img is None:
-            return None
-
-        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as tmp:
-            cv2.imwrite(tmp.name, img, [cv2.IMWRITE_JPEG_QUALITY, 90])
-            gcs_path = f"channel_banners/{cid}.jpg"
-            gcs_uri = upload_file_to_gcs(
-                GCS_BUCKET_DATA, gcs_path, tmp.name, content_type="image/jpeg"
-            )
-        return gcs_uri
+        resp = get_http_session().get(banner_url, timeout=10)
+        return _store_image_bytes(f"channel_banners/{cid}", resp.content)
     except Exception as e:
         LOGGER.warning(f"⚠️ Failed to save banner for {cid}: {e}")
         return None
 
 
-async def capture_home_screenshot(
-    context: PlaywrightContext, 
-    identifier: str
-) -> Optional[str]:
-    """Capture a screenshot of the channel's homepage.
+async def _wait_for_channel_content(page: Page, identifier: str) -> bool:
+    """Wait for a loaded channel homepage to render its content.
     
     Args:
-        context: Active PlaywrightContext
-        identifier: Channel ID or handle
+        page: Playwright page already navigated to the channel homepage
+        identifier: Channel ID or handle (for logging)
         
     Returns:
-        gs:// URI of uploaded screenshot, or None if failed
+        True if channel content rendered, False if removed or timed out
     """
-    url = get_channel_url(identifier)
-    page = await context.new_page()
+    # Give YouTube's JavaScript a moment to render the alert or content
+    await asyncio.sleep(2)
+    
+    # Check if channel has been removed/taken down OR if normal content loads
+    # YouTube shows yt-alert-renderer for removed/suspended channels
     try:
-        await page.goto(url, timeout=60000)
-        
-        # Give YouTube's JavaScript a moment to render the alert or content
-        await asyncio.sleep(2)
+        alert = await page.query_selector("yt-alert-renderer")
+        contents = await page.query_selector("#contents")
         
-        # Check if channel has been removed/taken down OR if normal content loads
-        # YouTube shows yt-alert-renderer for removed/suspended channels
-        channel_removed = False
-        try:
+        if alert and not contents:
+            error_text = await alert.inner_text()
+            LOGGER.warning(f"⛔ Channel {identifier} unavailable: {error_text.strip()[:100]}")
+            return False
+        elif not contents:
+            # Neither found - wait a bit more
+            await asyncio.sleep(3)
             alert = await page.query_selector("yt-alert-renderer")
             contents = await page.query_selector("#contents")
-            
-            if alert and not contents:
+            if alert:
                 error_text = await alert.inner_text()
                 LOGGER.warning(f"⛔ Channel {identifier} unavailable: {error_text.strip()[:100]}")
-                channel_removed = True
+                return False
             elif not contents:
-                # Neither found - wait a bit more
-                await asyncio.sleep(3)
-                alert = await page.query_selector("yt-alert-renderer")
-                contents = await page.query_selector("#contents")
-                if alert:
-                    error_text = await alert.inner_text()
-                    LOGGER.warning(f"⛔ Channel {identifier} unavailable: {error_text.strip()[:100]}")
-                    channel_removed = True
-                elif not contents:
-                    raise Exception("Neither alert nor contents found")
-        except Exception as e:
-            LOGGER.warning(f"⚠️ Timeout waiting for page content on {identifier}: {e}")
-            return None
-        
-        # Exit early if channel was removed
-        if channel_removed:
-            return None
+                raise Exception("Neither alert nor contents found")
+    except Exception as e:
+        LOGGER.warning(f"⚠️ Timeout waiting for page content on {identifier}: {e}")
+        return False
+    return True
+
+
+async def _goto_home(page: Page, url: str) -> None:
+    """Navigate to a channel homepage without waiting for the full load event.
+    
+    YouTube keeps loading resources long after the page shell is usable, so
+    the wait stops at DOMContentLoaded. A navigation timeout is tolerated:
+    _wait_for_channel_content then decides whether enough has rendered.
+    """
+    try:
+        await page.goto(url, wait_until="domcontentloaded", timeout=HOME_GOTO_TIMEOUT_MS)
+    except PlaywrightTimeoutError:
+        LOGGER.debug("Homepage navigation timed out, continuing with partial page: %s", url)
+
+
+async def _screenshot_home(page: Page) -> bytes:
+    """Scroll to load lazy thumbnails and take a full-page JPEG screenshot."""
+    await page.evaluate("window.scrollBy(0, 800)")  # Force load more elements
+    await asyncio.sleep(3)  # Give time for thumbnails to render
+    return await page.screenshot(full_page=True, type="jpeg", quality=80)
+
+
+async def capture_home_screenshot(
+    page: Page, 
+    identifier: str
+) -> Optional[str]:
+    """Capture a screenshot of the channel's homepage.
+    
+    Args:
+        page: Reusable Playwright page owned by the caller
+        identifier: Channel ID or handle
         
-        # At this point, #contents is already visible
-        await page.evaluate("window.scrollBy(0, 800)")  # Force load more elements
-        await asyncio.sleep(3)  # Give time for thumbnails to render
-        png = await page.screenshot(full_page=True)
-        return upload_png(GCS_BUCKET_DATA, identifier, png)
+    Returns:
+        gs:// URI of uploaded screenshot, or None if failed
+    """
+    url = get_channel_url(identifier)
+    try:
+        async with allow_heavy_resources(page):
+            await _goto_home(page, url)
+            if not await _wait_for_channel_content(page, identifier):
+                return None
+            jpeg = await _screenshot_home(page)
+        # The GCS upload blocks, so keep it off the loop
+        return await asyncio.to_thread(upload_jpeg, GCS_BUCKET_DATA, identifier, jpeg)
     except Exception as e:
         LOGGER.warning(f"⚠️ Screenshot failed for {identifier}: {e}")
         return None
-    finally:
-        await page.close()
+
+
+async def scrape_home_bundle(
+    page: Page,
+    identifier: str,
+    featured_limit: int = 50
+) -> Tuple[Optional[bytes], Optional[str], Optional[str], List[str]]:
+    """Screenshot the channel homepage and read avatar, banner and featured channels in one visit.
+    
+    Args:
+        page: Reusable Playwright page owned by the caller
+        identifier: Channel ID or handle
+        featured_limit: Maximum number of featured channels to read
+        
+    Returns:
+        Tuple of (screenshot JPEG bytes, avatar URL, banner URL, featured
+        channel IDs/handles); missing values are None (or an empty list)
+    """
+    url = get_channel_url(identifier)
+    avatar_url = banner_url = None
+    featured: List[str] = []
+    try:
+        async with allow_heavy_resources(page):
+            await _goto_home(page, url)
+            if not await _wait_for_channel_content(page, identifier):
+                return None, None, None, []
+
+            found = await page.evaluate(
+                _HOME_BUNDLE_JS, {"tiles": CHANNEL_TILE_SELECTOR, "limit": featured_limit}
+            )
+            avatar_url, banner_url = found["avatar"], found["banner"]
+            featured = _channels_from_hrefs(found["featured"])
+
+            jpeg = await _screenshot_home(page)
+        return jpeg, avatar_url, banner_url, featured
+    except Exception as e:
+        LOGGER.warning(f"⚠️ Homepage scrape failed for {identifier}: {e}")
+        return None, avatar_url, banner_url, featured
 
 
 def _normalize_handle(identifier: str) -> Optional[str]:
@@ -410,48 +657,130 @@ def fetch_channel_item(youtube, identifier: str) -> Optional[dict]:
         return None
 
 
+def fetch_channel_items(youtube, channel_ids: List[str]) -> Dict[str, Optional[dict]]:
+    """Fetch metadata for many UC channel IDs, CHANNELS_LIST_MAX_IDS per API call.
+    
+    Args:
+        youtube: YouTube API client
+        channel_ids: UC channel IDs (handles are ignored)
+        
+    Returns:
+        Dict mapping each fetched ID to its channel item, or None when the
+        API returned no item for it. IDs from failed calls are left out so
+        callers can retry them individually.
+    """
+    ids = [cid for cid in dict.fromkeys(channel_ids) if cid.startswith("UC")]
+    items: Dict[str, Optional[dict]] = {}
+    for i in range(0, len(ids), CHANNELS_LIST_MAX_IDS):
+        chunk = ids[i:i + CHANNELS_LIST_MAX_IDS]
+        try:
+            resp = (
+                youtube.channels()
+                .list(part=CHANNEL_PARTS, id=",".join(chunk), maxResults=CHANNELS_LIST_MAX_IDS)
+                .execute()
+            )
+        except Exception as exc:
+            LOGGER.warning(f"⚠️ Batched channels.list failed for {len(chunk)} IDs: {exc}")
+            continue
+        items.update(dict.fromkeys(chunk))
+        for item in resp.get("items", []):
+            items[item["id"]] = item
+    return items
+
+
 def resolve_handle_to_id(youtube, handle: str) -> Optional[str]:
     """Resolve @handle to channel ID using YouTube API."""
     item = fetch_channel_item(youtube, handle)
     return item.get("id") if item else None
 
 
+def _list_channel_sections(youtube, channel_id: str) -> dict:
+    """Fetch the channelSections response for a channel."""
+    return (
+        youtube.channelSections()
+        .list(part="snippet,contentDetails", channelId=channel_id)
+        .execute()
+    )
+
+
+async def _call_api(fn, *args):
+    """Run a blocking YouTube API helper on a worker thread.
+    
+    The API client (httplib2 underneath) is not thread-safe, so the call
+    gets the worker thread's own client instead of the shared one.
+    
+    Args:
+        fn: Helper taking the YouTube client as its first argument
+        *args: Remaining arguments for fn
+        
+    Returns:
+        Whatever fn returns
+    """
+    return await asyncio.to_thread(lambda: fn(get_thread_youtube(), *args))
+
+
 # ============================================================================
 # Page Scraping Functions
 # ============================================================================
 
+def _channels_from_hrefs(hrefs: List[Optional[str]]) -> List[str]:
+    """Convert channel tile hrefs (/@handle, /channel/UC...) to identifiers."""
+    channels = []
+    for href in hrefs:
+        if not href:
+            continue
+        if href.startswith("/@"):
+            channels.append(unquote(href[2:]))
+        elif href.startswith("/channel/"):
+            channels.append(href.split("/channel/")[1])
+    return channels
+
+
 async def scrape_about_page(
-    context: PlaywrightContext,
+    page: Page,
     identifier: str,
-    sub_limit: int = 50
+    sub_limit: int = 50,
+    humanize: bool = SCRAPE_HUMANIZE,
+    strict: bool = False,
+    goto_timeout_ms: int = 90000,
 ) -> Tuple[List[str], List[str]]:
     """Scrape external links and subscriptions from channel About page.
     
     Args:
-        context: Active PlaywrightContext
+        page: Reusable Playwright page owned by the caller
         identifier: Channel ID or handle
         sub_limit: Maximum number of subscriptions to scrape
+        humanize: Scroll/move the mouse like a person before scraping
+            (defaults to the SCRAPE_HUMANIZE env setting)
+        strict: Raise instead of returning empty lists when the page fails to
+            load or scrape, so callers can tell a failure from a page with no links
+        goto_timeout_ms: Navigation timeout for each of the three attempts
         
     Returns:
         Tuple of (about_links, subscriptions) where:
             - about_links: List of external URLs from the links section
             - subscriptions: List of channel IDs/handles from subscribed channels
+            
+    Raises:
+        RuntimeError: If strict and the About page could not be loaded
     """
     url = get_channel_url(identifier, "/about")
     about_links, subscriptions = [], []
-    page = None
 
     try:
-        # Open page safely
-        page = await context.new_page()
-
         # Try navigating with retry logic
         for attempt in range(3):
             try:
-                await page.goto(url, wait_until="domcontentloaded", timeout=90000)
+                await page.goto(url, wait_until="domcontentloaded", timeout=goto_timeout_ms)
                 
-                # Give YouTube's JavaScript a moment to render
-                await asyncio.sleep(3)
+                # Wait for either About content or a removal alert to render
+                try:
+                    await page.wait_for_selector(
+                        f"{ABOUT_READY_SELECTOR}, yt-alert-renderer", timeout=15000
+                    )
+                    page_loaded = True
+                except PlaywrightTimeoutError:
+                    page_loaded = False
                 
                 # Check if channel has been removed/taken down
                 # YouTube shows yt-alert-renderer for removed/suspended channels
@@ -469,18 +798,6 @@ async def scrape_about_page(
                 if channel_removed:
                     return about_links, subscriptions
                 
-                # Wait for About page specific content to appear
-                # Try multiple possible selectors
-                page_loaded = False
-                for selector in ["ytd-channel-about-metadata-renderer", "#description-container", "ytd-about-channel-renderer", "#page-header"]:
-                    try:
-                        element = await page.query_selector(selector)
-                        if element:
-                            page_loaded = True
-                            break
-                    except Exception:
-                        continue
-                
                 if not page_loaded:
                     # Debug: save page HTML to see what's actually there
                     try:
@@ -497,62 +814,57 @@ async def scrape_about_page(
                     
                     if attempt == 2:
                         # Last attempt failed, return empty results
+                        if strict:
+                            raise RuntimeError(f"About page never loaded for {identifier}")
                         return about_links, subscriptions
                     await asyncio.sleep(3)
                     continue
                 
-                # Give extra time for dynamic content
-                await humanize_page(page)
-                await asyncio.sleep(2)
+                if humanize:
+                    await humanize_page(page)
                 break
                 
             except Exception as e:
                 LOGGER.warning(f"⚠️ Navigation error for {identifier} (attempt {attempt+1}/3): {e}")
                 if attempt == 2:
+                    if strict:
+                        raise
                     return about_links, subscriptions
                 await asyncio.sleep(3)
 
-        # Scrape external links
-        anchors = await page.query_selector_all("#link-list-container a")
-        for a in anchors:
-            href = await a.get_attribute("href")
-            if href and "youtube.com/redirect" in href:
-                parsed = parse_qs(urlparse(href).query)
-                href = parsed.get("q", [href])[0]
-            if href:
-                about_links.append(href)
-
-        # Scrape subscriptions
-        subs = await page.query_selector_all(
-            "ytd-grid-channel-renderer a#channel-info, ytd-channel-renderer a.channel-link"
+        # Scrape external links (redirect wrappers are unwrapped in-page)
+        link_hrefs = await page.eval_on_selector_all(
+            "#link-list-container a", _ABOUT_LINK_HREFS_JS
         )
+        about_links = [href for href in link_hrefs if href]
 
-        for ch in subs[:sub_limit]:
-            href = await ch.get_attribute("href")
-            if href:
-                if href.startswith("/@"):
-                    subscriptions.append(unquote(href[2:]))
-                elif href.startswith("/channel/"):
-                    subscriptions.append(href.split("/channel/")[1])
+        # Scrape subscriptions
+        sub_hrefs = await page.eval_on_selector_all(CHANNEL_TILE_SELECTOR, _RAW_HREFS_JS)
+        subscriptions = _channels_from_hrefs(sub_hrefs[:sub_limit])
 
     except Exception as e:
         LOGGER.warning(f"⚠️ Error scraping About tab for {identifier}: {e}")
-
-    finally:
-        # Always close page safely
-        if page:
-            try:
-                await page.close()
-            except Exception as e:
-                LOGGER.debug(f"⚠️ Error closing page for {identifier}: {e}")
+        if strict:
+            raise
 
     return about_links, subscriptions
 
 
+# Scrolls the page top-to-bottom in random steps with random pauses, in-page
+_HUMANIZE_SCROLL_JS = """async () => {
+    const height = document.body.scrollHeight;
+    for (let y = 0; y < height; y += 250 + Math.random() * 550) {
+        window.scrollTo(0, y);
+        await new Promise(r => setTimeout(r, 100 + Math.random() * 500));
+    }
+}"""
+
+
 async def humanize_page(page: Page, min_wait: float = 0.5, max_wait: float = 2.0) -> None:
     """Simulate human-like behavior on the page to avoid bot detection.
     
-    Performs random scrolling, mouse movements, and pauses.
+    Performs random scrolling, a mouse movement, and pauses. The scroll loop
+    runs inside the page so it costs one round-trip instead of one per step.
     
     Args:
         page: Playwright Page instance
@@ -564,27 +876,19 @@ async def humanize_page(page: Page, min_wait: float = 0.5, max_wait: float = 2.0
 
     # Gentle scrolls
     try:
-        height = await page.evaluate("() => document.body.scrollHeight")
-        for y in range(0, height, random.randint(250, 800)):
-            try:
-                await page.evaluate(f"window.scrollTo(0, {y})")
-                await asyncio.sleep(random.uniform(0.1, 0.6))
-            except Exception:
-                break
+        await page.evaluate(_HUMANIZE_SCROLL_JS)
     except Exception:
         pass  # Page not ready for scrolling yet
 
-    # Small mouse movement
+    # Small mouse movement (kept on the input pipeline so events are trusted)
     try:
         viewport = page.viewport_size
         w, h = viewport["width"], viewport["height"]
-        for _ in range(random.randint(2, 6)):
-            await page.mouse.move(
-                random.randint(50, w - 50),
-                random.randint(50, h - 50),
-                steps=random.randint(10, 40)
-            )
-            await asyncio.sleep(random.uniform(0.05, 0.2))
+        await page.mouse.move(
+            random.randint(50, w - 50),
+            random.randint(50, h - 50),
+            steps=random.randint(10, 40)
+        )
     except Exception:
         pass
 
@@ -592,94 +896,46 @@ async def humanize_page(page: Page, min_wait: float = 0.5, max_wait: float = 2.0
     await asyncio.sleep(random.uniform(0.2, 0.8))
 
 
-def store_channel_domains(cid: str, urls: List[str]) -> None:
-    """Store channel About section URLs to Firestore channel_domains collection.
+def _normalize_domain(url: str) -> str:
+    """Return the lowercased host of a URL without its "www." prefix.
     
-    Args:
-        cid: Channel ID
-        urls: List of external URLs from channel About page
+    Plain string partitioning instead of urlparse: only the host is needed
+    and this never raises. Scheme-less URLs ("example.com/x") still yield
+    their host.
     """
-    for url in urls:
-        parsed = urlparse(url)
-        hostname = parsed.hostname or url
-        normalized_domain = hostname.lower().lstrip("www.") if hostname else None
+    _, sep, rest = url.partition("://")
+    host = (rest if sep else url).partition("/")[0].partition("?")[0].partition("#")[0]
+    # Drop userinfo and port
+    host = host.rpartition("@")[2].partition(":")[0].lower()
+    return host.removeprefix("www.")
 
-        db.collection("channel_domains").add({
-            "from_channel_id": cid,
-            "url": url,
-            "normalized_domain": normalized_domain,
-            "discovered_at": datetime.now(),
-            "source": "about_section",
-        })
-
-
-async def scrape_featured_channels(
-    context: PlaywrightContext,
-    identifier: str,
-    limit: int = 50
-) -> List[str]:
-    """Scrape featured channels from the channel's Channels tab.
-    
-    Args:
-        context: Active PlaywrightContext
-        identifier: Channel ID or handle
-        limit: Maximum number of featured channels to scrape
-        
-    Returns:
-        List of channel IDs/handles
-    """
-    url = get_channel_url(identifier)
-    featured = []
-    page = None
-    
-    try:
-        page = await context.new_page()
-        await page.goto(url, timeout=30000)
 
-        # Featured channels tiles
-        tiles = await page.query_selector_all(
-            "ytd-grid-channel-renderer a#channel-info, ytd-channel-renderer a.channel-link"
-        )
-        for t in tiles[:limit]:
-            href = await t.get_attribute("href")
-            if href:
-                if href.startswith("/@"):
-                    featured.append(unquote(href[2:]))
-                elif href.startswith("/channel/"):
-                    featured.append(href.split("/channel/")[1])
-    except Exception as e:
-        LOGGER.warning(f"⚠️ Failed to scrape featured channels for {identifier}: {e}")
-    finally:
-        if page:
-            await page.close()
-    return featured
+def _edge_doc_id(*parts: str) -> str:
+    """Deterministic document ID for an edge, so re-discovery overwrites instead of duplicating."""
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()[:20]
 
 
-async def scrape_avatar_url(context: PlaywrightContext, identifier: str) -> Optional[str]:
-    """Scrape channel avatar image URL from homepage.
+def store_channel_domains(cid: str, urls: List[str], batch) -> None:
+    """Stage channel About section URLs for the channel_domains collection.
+    
+    Each (channel, URL) pair maps to one document, so re-crawls update it
+    rather than adding another.
     
     Args:
-        context: Active PlaywrightContext
-        identifier: Channel ID or handle
-        
-    Returns:
-        Avatar image URL, or None if not found
+        cid: Channel ID
+        urls: List of external URLs from channel About page
+        batch: Channel write buffer the writes are added to
     """
-    url = get_channel_url(identifier)
-    page = None
-    
-    try:
-        page = await context.new_page()
-        await page.goto(url, timeout=30000)
-        img = await page.query_selector("img.ytCoreImageHost")
-        if img:
-            return await img.get_attribute("src")
-    except Exception as e:
-        LOGGER.warning(f"⚠️ Failed to scrape avatar for {identifier}: {e}")
-    finally:
-        if page:
-            await page.close()
-    return None
+    now = datetime.now()
+    domains = db.collection("channel_domains")
+    for url in urls:
+        batch.set(domains.document(_edge_doc_id(cid, url)), {
+            "from_channel_id": cid,
+            "url": url,
+            "normalized_domain": _normalize_domain(url),
+            "discovered_at": now,
+            "source": "about_section",
+        }, merge=True)
 
 
 def upgrade_avatar_url(url: str, target_size: int = 256) -> str:
@@ -694,13 +950,36 @@ def upgrade_avatar_url(url: str, target_size: int = 256) -> str:
     """
     if not url:
         return url
-    return re.sub(r"=s\d+-", f"=s{target_size}-", url)
+    return _AVATAR_SIZE_RE.sub(f"=s{target_size}-", url)
+
+
+def _store_image_bytes(gcs_stem: str, content: bytes) -> Optional[str]:
+    """Upload already-encoded image bytes to GCS without re-encoding.
+    
+    Args:
+        gcs_stem: Destination path without extension
+        content: Downloaded image bytes
+        
+    Returns:
+        gs:// URI of uploaded image, or None if bytes are not an image
+    """
+    content_type = sniff_image_type(content)
+    if not content_type:
+        return None
+    return upload_bytes_to_gcs(
+        GCS_BUCKET_DATA, f"{gcs_stem}{IMAGE_EXTENSIONS[content_type]}", content, content_type=content_type
+    )
 
 
-def download_and_store_avatar(cid: str, avatar_url: str) -> Optional[str]:
+async def download_and_store_avatar(
+    http: httpx.AsyncClient,
+    cid: str,
+    avatar_url: str
+) -> Optional[str]:
     """Download avatar image from URL and save to GCS.
     
     Args:
+        http: Shared async HTTP client
         cid: Channel ID
         avatar_url: Avatar image URL
         
@@ -708,82 +987,137 @@ def download_and_store_avatar(cid: str, avatar_url: str) -> Optional[str]:
         gs:// URI of uploaded avatar, or None if failed
     """
     try:
-        resp = requests.get(upgrade_avatar_url(avatar_url, 800), timeout=10)
-        arr = np.frombuffer(resp.content, dtype=np.uint8)
-        img = cv2.imdecode(arr, cv2.IMREAD_COLOR)
-        if img is None:
-            return None
-
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-            cv2.imwrite(tmp.name, img, [cv2.IMWRITE_PNG_COMPRESSION, 3])
-            gcs_path = f"channel_avatars/{cid}.png"
-            return upload_file_to_gcs(
-                GCS_BUCKET_DATA, gcs_path, tmp.name, content_type="image/png"
-            )
+        resp = await http.get(upgrade_avatar_url(avatar_url, AVATAR_STORE_SIZE))
+        # The GCS upload blocks, so keep it off the loop
+        return await asyncio.to_thread(_store_image_bytes, f"channel_avatars/{cid}", resp.content)
     except Exception as e:
         LOGGER.warning(f"⚠️ Failed to download avatar {cid}: {e}")
         return None
 
 
-async def scrape_banner_url(context: PlaywrightContext, identifier: str) -> Optional[str]:
-    """Scrape channel banner image URL from homepage.
+async def download_and_store_banner(
+    http: httpx.AsyncClient,
+    cid: str,
+    banner_url: str
+) -> Optional[str]:
+    """Download banner image from URL and save to GCS.
     
     Args:
-        context: Active PlaywrightContext
-        identifier: Channel ID or handle
+        http: Shared async HTTP client
+        cid: Channel ID
+        banner_url: Banner image URL
         
     Returns:
-        Banner image URL, or None if not found
+        gs:// URI of uploaded banner, or None if failed
     """
-    url = get_channel_url(identifier)
-    page = None
-    
     try:
-        page = await context.new_page()
-        await page.goto(url, timeout=30000)
-        img = await page.query_selector("yt-image-banner-view-model img")
-        if img:
-            return await img.get_attribute("src")
+        resp = await http.get(banner_url)
+        return await asyncio.to_thread(_store_image_bytes, f"channel_banners/{cid}", resp.content)
     except Exception as e:
-        LOGGER.warning(f"⚠️ Failed to scrape banner for {identifier}: {e}")
-    finally:
-        if page:
-            await page.close()
-    return None
+        LOGGER.warning(f"⚠️ Failed to download banner {cid}: {e}")
+        return None
 
 
-def download_and_store_banner(cid: str, banner_url: str) -> Optional[str]:
-    """Download banner image from URL and save to GCS.
+async def _store_home_media(
+    http: httpx.AsyncClient,
+    cid: str,
+    jpeg: Optional[bytes],
+    avatar_url: Optional[str],
+    banner_url: Optional[str]
+) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Upload a homepage screenshot and download/store avatar and banner concurrently.
     
     Args:
-        cid: Channel ID
-        banner_url: Banner image URL
+        http: Shared async HTTP client
+        cid: Channel ID or handle
+        jpeg: Screenshot JPEG bytes (or None)
+        avatar_url: Scraped avatar URL (or None)
+        banner_url: Scraped banner URL (or None)
         
     Returns:
-        gs:// URI of uploaded banner, or None if failed
+        Tuple of gs:// URIs (screenshot, avatar, banner); None where missing or failed
     """
-    try:
-        resp = requests.get(banner_url, timeout=10)
-        arr = np.frombuffer(resp.content, dtype=np.uint8)
-        img = cv2.imdecode(arr, cv2.IMREAD_COLOR)
-        if img is None:
+    async def none() -> None:
+        return None
+
+    async def upload_screenshot() -> Optional[str]:
+        try:
+            return await asyncio.to_thread(upload_jpeg, GCS_BUCKET_DATA, cid, jpeg)
+        except Exception as e:
+            LOGGER.warning(f"⚠️ Failed to upload screenshot for {cid}: {e}")
             return None
 
-        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as tmp:
-            cv2.imwrite(tmp.name, img, [cv2.IMWRITE_JPEG_QUALITY, 90])
-            gcs_path = f"channel_banners/{cid}.jpg"
-            return upload_file_to_gcs(
-                GCS_BUCKET_DATA, gcs_path, tmp.name, content_type="image/jpeg"
-            )
-    except Exception as e:
-        LOGGER.warning(f"⚠️ Failed to download banner {cid}: {e}")
-        return None
+    screenshot_uri, avatar_gcs_uri, banner_gcs_uri = await asyncio.gather(
+        upload_screenshot() if jpeg else none(),
+        download_and_store_avatar(http, cid, avatar_url) if avatar_url else none(),
+        download_and_store_banner(http, cid, banner_url) if banner_url else none(),
+    )
+    return screenshot_uri, avatar_gcs_uri, banner_gcs_uri
 
 
 # ============================================================================
 # Firestore Document Management
 # ============================================================================
 
+class _ChannelWrites:
+    """Buffer of one channel's Firestore writes, handed to a BulkWriter at the end.
+    
+    Writes are staged both on the event loop and from worker threads (e.g.
+    _init_channel_doc), so they are collected here and only passed to the
+    shared BulkWriter from the loop once the channel has been processed.
+    """
+
+    def __init__(self) -> None:
+        self._ops: List[Tuple] = []
+
+    def set(self, doc_ref, data: dict, merge: bool = False) -> None:
+        """Stage a set() write."""
+        self._ops.append((doc_ref, data, merge))
+
+    def flush_to(self, writer: BulkWriter) -> None:
+        """Hand the staged writes to a BulkWriter and clear the buffer."""
+        for doc_ref, data, merge in self._ops:
+            writer.set(doc_ref, data, merge=merge)
+        self._ops.clear()
+
+
+class _KnownChannels:
+    """Channel IDs confirmed to exist in Firestore, plus IDs staged this run.
+    
+    Staged IDs only block duplicate creates within the run; an ID is
+    confirmed (and so persisted to KNOWN_CHANNELS_BLOB) once an existence
+    read finds its doc or the BulkWriter reports its write committed.
+    """
+
+    def __init__(self, confirmed: Set[str]) -> None:
+        self._confirmed = confirmed
+        self._staged: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def __contains__(self, cid: str) -> bool:
+        with self._lock:
+            return cid in self._confirmed or cid in self._staged
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._confirmed)
+
+    def stage(self, cid: str) -> None:
+        """Record a create that has been staged but not yet committed."""
+        with self._lock:
+            self._staged.add(cid)
+
+    def confirm(self, cid: str) -> None:
+        """Record a channel doc that is known to exist."""
+        with self._lock:
+            self._confirmed.add(cid)
+
+    def snapshot(self) -> Set[str]:
+        """Copy of the confirmed IDs, safe to save while writes still land."""
+        with self._lock:
+            return set(self._confirmed)
+
+
 def _init_channel_doc(
     batch,
     cid: str,
@@ -791,24 +1125,40 @@ def _init_channel_doc(
     screenshot_uri: Optional[str],
     scraped_only: bool = False,
     is_bot: bool = True,
-    bot_check_type: str = "propagated"
+    bot_check_type: str = "propagated",
+    avatar_url: Optional[str] = None,
+    avatar_gcs_uri: Optional[str] = None,
+    banner_url: Optional[str] = None,
+    banner_gcs_uri: Optional[str] = None,
+    known: Optional[_KnownChannels] = None,
 ) -> None:
     """Initialize a channel Firestore document with metadata and metrics.
     
     Args:
-        batch: Firestore batch write
+        batch: Channel write buffer the writes are added to
         cid: Channel ID
         channel_item: YouTube API channel response item (or None)
         screenshot_uri: gs:// URI of screenshot (or None)
         scraped_only: If True, store skeleton doc with is_metadata_missing=True
         is_bot: Bot status (True=confirmed bot, False=pending review)
         bot_check_type: How bot status was determined (e.g., "propagated", "pending_review", "manual")
+        avatar_url: Scraped avatar URL (used when no API item is available)
+        avatar_gcs_uri: gs:// URI of an already stored avatar
+        banner_url: Scraped banner URL (used when no API item is available)
+        banner_gcs_uri: gs:// URI of an already stored banner
+        known: Channel IDs known to exist or staged this run; skips the existence
+            read for them. Reads that find a doc confirm the ID, and a staged
+            create is only confirmed once the BulkWriter commits it
     """
     doc_ref = db.collection("channel").document(cid)
+    if known is not None and cid in known:
+        return
     if doc_ref.get().exists:
+        if known is not None:
+            known.confirm(cid)
         return
 
-    avatar_url, avatar_gcs_uri, banner_gcs_uri, metrics = None, None, None, {}
+    metrics = {}
 
     if channel_item and not scraped_only:
         # Extract avatar URL from snippet
@@ -830,10 +1180,11 @@ def _init_channel_doc(
             except Exception as e:
                 LOGGER.warning(f"⚠️ Failed to classify avatar {cid}: {e}")
 
+    now = datetime.now()
     data = {
         "channel_id": cid,
-        "registered_at": datetime.now(),
-        "last_checked_at": datetime.now(),
+        "registered_at": now,
+        "last_checked_at": now,
         "is_bot": is_bot,
         "is_bot_check_type": bot_check_type,
         "is_bot_checked": is_bot,  # Only mark as checked if is_bot is True
@@ -841,12 +1192,38 @@ def _init_channel_doc(
         "screenshot_gcs_uri": screenshot_uri,
         "avatar_url": avatar_url,
         "avatar_gcs_uri": avatar_gcs_uri,
+        "banner_url": banner_url,
         "banner_gcs_uri": banner_gcs_uri,
         "avatar_metrics": metrics,
         "is_metadata_missing": scraped_only,
     }
 
     batch.set(doc_ref, data)
+    if known is not None:
+        known.stage(cid)
+
+
+def _stage_channel_link(batch, written_links: Set[Tuple[str, str, str]], link: dict) -> bool:
+    """Stage a channel_links document unless this run already wrote the same edge.
+    
+    The document ID is derived from (from, to, source), so edges found again
+    by later runs overwrite their existing document.
+    
+    Args:
+        batch: Channel write buffer the write is added to
+        written_links: (from, to, source) keys already written this run
+        link: channel_links document data
+        
+    Returns:
+        True if the link was staged, False if it was a duplicate
+    """
+    to = link.get("to_channel_id") or link.get("to_channel_handle")
+    key = (link["from_channel_id"], to, link["source"])
+    if key in written_links:
+        return False
+    written_links.add(key)
+    batch.set(db.collection("channel_links").document(_edge_doc_id(*key)), link, merge=True)
+    return True
 
 
 # ============================================================================
@@ -858,26 +1235,35 @@ def _init_channel_doc(
 # ═══════════════════════════════════════════════════════════════════
 
 async def _process_channel_with_api(
-    youtube, 
-    context: PlaywrightContext, 
+    page: Page, 
     identifier: str, 
     batch,
     seen: set,
-    queue: list,
+    queue: asyncio.Queue,
+    known: _KnownChannels,
+    written_links: Set[Tuple[str, str, str]],
+    channel_items: Dict[str, Optional[dict]],
     is_bot: bool = True,
     bot_check_type: str = "propagated"
 ) -> list[str]:
     """Process a channel using YouTube API.
     
     Args:
+        known: Channel IDs already known to exist in Firestore
+        written_links: (from, to, source) link keys already written this run
+        channel_items: Channel items prefetched in batches for queued IDs
+            (consumed here; newly queued featured channels are added)
         is_bot: Bot status for this channel
         bot_check_type: How bot status was determined
         
     Returns:
         List of subscription channel IDs/handles
     """
-    # Fetch channel metadata via API
-    channel_item = fetch_channel_item(youtube, identifier)
+    # Fetch channel metadata via API, unless a batched call already did
+    if identifier in channel_items:
+        channel_item = channel_items.pop(identifier)
+    else:
+        channel_item = await _call_api(fetch_channel_item, identifier)
     if not channel_item:
         LOGGER.warning(f"⚠️ No channel data for {identifier}")
         return []
@@ -889,107 +1275,109 @@ async def _process_channel_with_api(
         LOGGER.info(f"🔁 Resolved {identifier} → {channel_id}")
     identifier = channel_id
 
-    write_json_to_gcs(GCS_BUCKET_DATA, channel_metadata_raw_path(identifier), channel_item)
+    await asyncio.to_thread(
+        write_json_to_gcs, GCS_BUCKET_DATA, channel_metadata_raw_path(identifier), channel_item
+    )
 
     # Capture screenshot
-    screenshot_uri = await capture_home_screenshot(context, identifier)
+    screenshot_uri = await capture_home_screenshot(page, identifier)
+    now = datetime.now()
     
     # Initialize channel doc or pending doc
     if identifier.startswith("UC"):
-        _init_channel_doc(batch, identifier, channel_item, screenshot_uri, 
-                         scraped_only=False, is_bot=is_bot, bot_check_type=bot_check_type)
+        # Avatar/banner download + upload and classification all block,
+        # so run them on a thread while other workers keep scraping
+        await asyncio.to_thread(
+            _init_channel_doc, batch, identifier, channel_item, screenshot_uri,
+            scraped_only=False, is_bot=is_bot, bot_check_type=bot_check_type,
+            known=known,
+        )
     else:
-        db.collection("channel_pending").document(identifier).set({
+        batch.set(db.collection("channel_pending").document(identifier), {
             "handle": identifier,
             "screenshot_gcs_uri": screenshot_uri,
             "is_metadata_missing": True,
             "is_bot": is_bot,
             "is_bot_check_type": bot_check_type,
-            "discovered_at": datetime.now(),
-            "last_checked_at": datetime.now(),
+            "discovered_at": now,
+            "last_checked_at": now,
         }, merge=True)
     
     # Fetch channel sections
-    sec = (
-        youtube.channelSections()
-    .list(part="snippet,contentDetails", channelId=identifier)
-        .execute()
+    sec = await _call_api(_list_channel_sections, identifier)
+    await asyncio.to_thread(
+        write_json_to_gcs, GCS_BUCKET_DATA, channel_sections_raw_path(identifier), sec
     )
-    write_json_to_gcs(GCS_BUCKET_DATA, channel_sections_raw_path(identifier), sec)
 
     # Scrape about page
-    about_links, subs = await scrape_about_page(context, identifier)
+    about_links, subs = await scrape_about_page(page, identifier)
     if about_links:
-        store_channel_domains(identifier, about_links)
+        store_channel_domains(identifier, about_links, batch)
         LOGGER.info(f"🔗 Stored {len(about_links)} About links for {identifier}")
 
     # Process featured channels from API
+    queued = []
     for item in sec.get("items", []):
         if item.get("snippet", {}).get("type") == "multiplechannels":
             for featured in item.get("contentDetails", {}).get("channels", []):
                 if featured not in seen:
                     seen.add(featured)
-                    queue.append(featured)
+                    queue.put_nowait(featured)
+                    queued.append(featured)
                     LOGGER.info(f"➕ Queued featured channel {featured}")
-                    db.collection("channel_links").add({
+                    _stage_channel_link(batch, written_links, {
                         "from_channel_id": identifier,
                         "to_channel_id": featured,
-                        "discovered_at": datetime.now(),
+                        "discovered_at": now,
                         "source": "channelSections",
                     })
+    channel_items.update(await _call_api(fetch_channel_items, queued))
     
     return subs
 
 
 async def _process_channel_without_api(
-    context: PlaywrightContext,
+    page: Page,
+    http: httpx.AsyncClient,
     identifier: str,
     batch,
     seen: set,
-    queue: list,
+    queue: asyncio.Queue,
+    known: _KnownChannels,
+    written_links: Set[Tuple[str, str, str]],
     is_bot: bool = True,
     bot_check_type: str = "propagated"
 ) -> list[str]:
     """Process a channel without YouTube API (scraping only).
     
     Args:
+        http: Shared async HTTP client for avatar/banner downloads
+        known: Channel IDs already known to exist in Firestore
+        written_links: (from, to, source) link keys already written this run
         is_bot: Bot status for this channel
         bot_check_type: How bot status was determined
         
     Returns:
         List of subscription channel IDs/handles
     """
-    # Capture screenshot
-    screenshot_uri = await capture_home_screenshot(context, identifier)
-
-    # Scrape avatar
-    avatar_url = await scrape_avatar_url(context, identifier)
-    avatar_gcs_uri = download_and_store_avatar(identifier, avatar_url) if avatar_url else None
-
-    # Scrape banner
-    banner_url = await scrape_banner_url(context, identifier)
-    banner_gcs_uri = download_and_store_banner(identifier, banner_url) if banner_url else None
+    # Screenshot, avatar, banner and featured channels from a single homepage visit
+    jpeg, avatar_url, banner_url, featured = await scrape_home_bundle(page, identifier)
+    screenshot_uri, avatar_gcs_uri, banner_gcs_uri = await _store_home_media(
+        http, identifier, jpeg, avatar_url, banner_url
+    )
+    now = datetime.now()
 
-    # Store channel or pending doc
+    # Store channel or pending doc (existence reads for unknown IDs block, so run on a thread)
     if identifier.startswith("UC"):
-        data = {
-            "channel_id": identifier,
-            "registered_at": datetime.now(),
-            "last_checked_at": datetime.now(),
-            "is_bot": is_bot,
-            "is_bot_check_type": bot_check_type,
-            "is_bot_checked": is_bot,
-            "is_screenshot_stored": bool(screenshot_uri),
-            "screenshot_gcs_uri": screenshot_uri,
-            "avatar_url": avatar_url,
-            "avatar_gcs_uri": avatar_gcs_uri,
-            "banner_url": banner_url,
-            "banner_gcs_uri": banner_gcs_uri,
-            "is_metadata_missing": True,
-        }
-        batch.set(db.collection("channel").document(identifier), data)
+        await asyncio.to_thread(
+            _init_channel_doc, batch, identifier, None, screenshot_uri, scraped_only=True,
+            is_bot=is_bot, bot_check_type=bot_check_type,
+            avatar_url=avatar_url, avatar_gcs_uri=avatar_gcs_uri,
+            banner_url=banner_url, banner_gcs_uri=banner_gcs_uri,
+            known=known,
+        )
     else:
-        db.collection("channel_pending").document(identifier).set({
+        batch.set(db.collection("channel_pending").document(identifier), {
             "handle": identifier,
             "screenshot_gcs_uri": screenshot_uri,
             "avatar_url": avatar_url,
@@ -999,102 +1387,110 @@ async def _process_channel_without_api(
             "is_bot": is_bot,
             "is_bot_check_type": bot_check_type,
             "is_metadata_missing": True,
-            "discovered_at": datetime.now(),
-            "last_checked_at": datetime.now(),
+            "discovered_at": now,
+            "last_checked_at": now,
         }, merge=True)
 
-    # Scrape featured channels
-    featured = await scrape_featured_channels(context, identifier)
+    # Featured channels read during the homepage visit
     for f in featured:
         if f.startswith("UC"):
             # Real channel ID
             if f not in seen:
                 seen.add(f)
-                queue.append(f)
+                queue.put_nowait(f)
                 LOGGER.info(f"➕ Queued (scraped) featured channel {f}")
-                db.collection("channel_links").add({
+                _stage_channel_link(batch, written_links, {
                     "from_channel_id": identifier,
                     "to_channel_id": f,
-                    "discovered_at": datetime.now(),
+                    "discovered_at": now,
                     "source": "featured_scrape",
                     "needs_resolution": False,
                 })
-                fb = db.batch()
-                _init_channel_doc(fb, f, None, None, scraped_only=True, 
-                                is_bot=is_bot, bot_check_type=bot_check_type)
-                fb.commit()
+                await asyncio.to_thread(
+                    _init_channel_doc, batch, f, None, None, scraped_only=True,
+                    is_bot=is_bot, bot_check_type=bot_check_type, known=known,
+                )
         else:
             # Handle - needs resolution
             if f not in seen:
                 seen.add(f)
-                queue.append(f)
+                queue.put_nowait(f)
             LOGGER.info(f"➕ Queued (scraped) handle {f} (needs API resolution)")
-            db.collection("channel_links").add({
+            if not _stage_channel_link(batch, written_links, {
                 "from_channel_id": identifier,
                 "to_channel_handle": f,
-                "discovered_at": datetime.now(),
+                "discovered_at": now,
                 "source": "featured_scrape",
                 "needs_resolution": True,
-            })
-            db.collection("channel_pending").document(f).set({
+            }):
+                continue
+            batch.set(db.collection("channel_pending").document(f), {
                 "handle": f,
-                "discovered_at": datetime.now(),
+                "discovered_at": now,
                 "source": "featured_scrape",
                 "needs_resolution": True,
             })
 
     # Scrape about page
-    about_links, subs = await scrape_about_page(context, identifier)
+    about_links, subs = await scrape_about_page(page, identifier)
     if about_links:
-        store_channel_domains(identifier, about_links)
+        store_channel_domains(identifier, about_links, batch)
         LOGGER.info(f"🔗 Stored {len(about_links)} About links for {identifier}")
     
     return subs
 
 
-def _process_subscriptions(
+async def _process_subscriptions(
     subs: list[str],
     identifier: str,
-    youtube,
+    batch,
     seen: set,
-    queue: list,
+    queue: asyncio.Queue,
+    written_links: Set[Tuple[str, str, str]],
     use_api: bool,
     is_bot: bool = True,
     bot_check_type: str = "propagated"
-) -> None:
+) -> List[str]:
     """Process subscription channels and add to queue.
     
     Args:
         subs: List of channel IDs or handles from subscriptions
         identifier: Parent channel ID or handle
-        youtube: YouTube API client (or None if not using API)
+        batch: Channel write buffer the link/pending writes are added to
         seen: Set of already-processed channel identifiers
         queue: Queue of channels to process
+        written_links: (from, to, source) link keys already written this run
         use_api: Whether to use YouTube API for handle resolution
         is_bot: Bot status to assign to discovered channels
         bot_check_type: How bot status was determined
+        
+    Returns:
+        UC channel IDs newly added to the queue
     """
+    now = datetime.now()
+    queued = []
     for sub in subs:
         if sub.startswith("UC"):
             sub_id = sub
         else:
             if use_api:
-                sub_id = resolve_handle_to_id(youtube, sub) or sub
+                sub_id = await _call_api(resolve_handle_to_id, sub) or sub
             else:
                 # Handle without API - enqueue for recursive processing
                 if sub not in seen:
                     seen.add(sub)
-                    queue.append(sub)
-                db.collection("channel_links").add({
+                    queue.put_nowait(sub)
+                if not _stage_channel_link(batch, written_links, {
                     "from_channel_id": identifier,
                     "to_channel_handle": sub,
-                    "discovered_at": datetime.now(),
+                    "discovered_at": now,
                     "source": "subscriptions",
                     "needs_resolution": True,
-                })
-                db.collection("channel_pending").document(sub).set({
+                }):
+                    continue
+                batch.set(db.collection("channel_pending").document(sub), {
                     "handle": sub,
-                    "discovered_at": datetime.now(),
+                    "discovered_at": now,
                     "source": "subscriptions",
                     "needs_resolution": True,
                 })
@@ -1103,15 +1499,17 @@ def _process_subscriptions(
         # Only enqueue if we have a usable UC ID
         if sub_id not in seen and sub_id.startswith("UC"):
             seen.add(sub_id)
-            queue.append(sub_id)
+            queue.put_nowait(sub_id)
+            queued.append(sub_id)
             LOGGER.info(f"➕ Queued subscription channel {sub_id}")
-            db.collection("channel_links").add({
+            _stage_channel_link(batch, written_links, {
                 "from_channel_id": identifier,
                 "to_channel_id": sub_id,
-                "discovered_at": datetime.now(),
+                "discovered_at": now,
                 "source": "subscriptions",
                 "needs_resolution": False,
             })
+    return queued
 
 
 async def expand_bot_graph_async(
@@ -1119,6 +1517,7 @@ async def expand_bot_graph_async(
     use_api: bool = False,
     is_bot: bool = True,
     bot_check_type: str = "propagated",
+    concurrency: int = DEFAULT_CONCURRENCY,
 ) -> None:
     """Expand the bot graph by recursively discovering channels.
     
@@ -1128,58 +1527,136 @@ async def expand_bot_graph_async(
     - About page external links
     - Screenshots and avatars
     
-    Stores all data to Firestore and GCS.
+    Stores all data to Firestore and GCS. Channels are processed by a pool of
+    concurrent workers pulling from a shared queue; newly discovered channels
+    are enqueued while the crawl is in flight.
     
     Args:
         seed_channels: Initial list of channel IDs or handles to start expansion from
         use_api: Whether to fetch channel metadata via the YouTube API (True) or rely on scraping only (False)
         is_bot: Bot status for discovered channels (True=confirmed, False=pending review)
         bot_check_type: How bot status was determined (e.g., "propagated", "pending_review", "manual")
+        concurrency: Number of channels processed in parallel
     """
     if not seed_channels:
         LOGGER.info("No seed channels passed")
         return
     
-    youtube = get_youtube() if use_api else None
-    seen, queue = set(seed_channels), list(seed_channels)
+    # `seen` is only touched between awaits, so the single-threaded event loop
+    # keeps check-and-add atomic without a lock.
+    seen = set(seed_channels)
+    # Channel IDs known to exist from earlier runs, so only unseen IDs need an existence read
+    # (channel docs are never deleted by the pipeline, so the snapshot stays valid)
+    known = _KnownChannels(await asyncio.to_thread(read_id_set, GCS_BUCKET_DATA, KNOWN_CHANNELS_BLOB))
+    LOGGER.info(f"📚 Loaded {len(known)} known channel IDs")
+    # (from, to, source) edges already written, so re-encountered links aren't duplicated
+    written_links: Set[Tuple[str, str, str]] = set()
+    queue: asyncio.Queue = asyncio.Queue()
+    for seed in seen:
+        queue.put_nowait(seed)
+    # Metadata for queued UC IDs, fetched CHANNELS_LIST_MAX_IDS per API call
+    # as IDs are discovered instead of one call per channel
+    channel_items: Dict[str, Optional[dict]] = (
+        await _call_api(fetch_channel_items, list(seen)) if use_api else {}
+    )
+    # One BulkWriter for the whole crawl pipelines writes across channels
+    writer = make_bulk_writer(db)
 
-    LOGGER.info(f"🚀 Starting expansion with {len(queue)} seeds")
+    def _on_write_result(doc_ref, _result, _writer) -> None:
+        # Runs on the BulkWriter's threads once a write has committed
+        if doc_ref.parent.id == "channel":
+            known.confirm(doc_ref.id)
 
-    async with PlaywrightContext() as context:
-        while queue:
-            identifier = queue.pop(0)
-            
+    writer.on_write_result(_on_write_result)
+
+    LOGGER.info(f"🚀 Starting expansion with {queue.qsize()} seeds ({concurrency} workers)")
+
+    async def worker(context: PlaywrightContext) -> None:
+        while True:
+            identifier = await queue.get()
             try:
-                batch = db.batch()
+                batch = _ChannelWrites()
                 subs: list[str] = []
                 
-                # Process channel with or without API
-                if use_api:
-                    subs = await _process_channel_with_api(
-                        youtube, context, identifier, batch, seen, queue,
-                        is_bot=is_bot, bot_check_type=bot_check_type
-                    )
-                else:
-                    subs = await _process_channel_without_api(
-                        context, identifier, batch, seen, queue,
-                        is_bot=is_bot, bot_check_type=bot_check_type
-                    )
+                # Process channel with or without API on a pooled page
+                async with context.pages.acquire() as page:
+                    if use_api:
+                        subs = await _process_channel_with_api(
+                            page, identifier, batch, seen, queue, known, written_links,
+                            channel_items, is_bot=is_bot, bot_check_type=bot_check_type
+                        )
+                    else:
+                        subs = await _process_channel_without_api(
+                            page, context.http, identifier, batch, seen, queue, known, written_links,
+                            is_bot=is_bot, bot_check_type=bot_check_type
+                        )
                 
                 # Process subscriptions from about page
-                _process_subscriptions(subs, identifier, youtube, seen, queue, use_api,
-                                     is_bot=is_bot, bot_check_type=bot_check_type)
+                queued = await _process_subscriptions(subs, identifier, batch, seen, queue, written_links,
+                                                use_api, is_bot=is_bot, bot_check_type=bot_check_type)
+                if use_api:
+                    channel_items.update(await _call_api(fetch_channel_items, queued))
                 
-                # Commit batch
-                batch.commit()
+                # Hand this channel's writes to the shared BulkWriter
+                batch.flush_to(writer)
                 
             except HttpError as e:
                 LOGGER.error(f"❌ API error for {identifier}: {e}")
             except Exception as e:
                 LOGGER.exception(f"💥 Unexpected error for {identifier}: {e}")
+            finally:
+                queue.task_done()
+
+    async with PlaywrightContext(max_pages=concurrency) as context:
+        workers = [asyncio.create_task(worker(context)) for _ in range(max(1, concurrency))]
+        try:
+            # join() (not emptiness) detects completion, so channels discovered
+            # mid-flight are still processed before we stop.
+            await queue.join()
+        finally:
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            # Wait for every pending write, even on interrupt
+            await asyncio.to_thread(writer.close)
+            try:
+                snapshot = known.snapshot()
+                await asyncio.to_thread(write_id_set, GCS_BUCKET_DATA, KNOWN_CHANNELS_BLOB, snapshot)
+                LOGGER.info(f"💾 Saved {len(snapshot)} known channel IDs to {KNOWN_CHANNELS_BLOB}")
+            except Exception as e:
+                LOGGER.warning(f"⚠️ Failed to save known channel IDs: {e}")
 
     LOGGER.info(f"🎉 Expansion complete. Total channels discovered: {len(seen)}")
 
 
+async def _load_seed_channels() -> List[str]:
+    """Load expansion seeds from Firestore (confirmed bots + unresolved handles).
+    
+    Both queries project only document IDs and run concurrently in worker
+    threads, so large seed sets are neither deserialized nor fetched serially.
+    The bot query relies on the composite index (is_bot_checked, is_bot).
+    
+    Returns:
+        List of channel IDs/handles to seed the expansion with
+    """
+    bots_query = (
+        db.collection("channel")
+        .where("is_bot_checked", "==", True)
+        .where("is_bot", "==", True)
+        .select([])
+    )
+    pending_query = (
+        db.collection("channel_pending")
+        .where("needs_resolution", "==", True)
+        .select([])
+    )
+    seeds, additional_seeds = await asyncio.gather(
+        asyncio.to_thread(lambda: [d.id for d in bots_query.stream()]),
+        asyncio.to_thread(lambda: [d.id for d in pending_query.stream()]),
+    )
+    return seeds + additional_seeds
+
+
 # ───── Entrypoint ─────
 if __name__ == "__main__":
     import argparse
@@ -1192,26 +1669,19 @@ if __name__ == "__main__":
         default=False,
         help="Use the YouTube Data API for channel metadata (default: scrape only)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="Number of channels expanded in parallel",
+    )
     args = parser.parse_args()
 
     if not args.seed_channels:
         LOGGER.info("📂 No seeds provided → querying Firestore for all known bots")
-        seeds = [
-            d.id
-            for d in db.collection("channel")
-            .where("is_bot_checked", "==", True)
-            .where("is_bot", "==", True)
-            .stream()
-        ]
-        additional_seeds = [
-            d.id
-            for d in db.collection("channel_pending")
-            .where("needs_resolution", "==", True)
-            .stream()
-        ]
-        seeds = seeds + additional_seeds
+        seeds = asyncio.run(_load_seed_channels())
         LOGGER.info(f"   → Got {len(seeds)} seeds from Firestore")
     else:
         seeds = args.seed_channels
 
-    asyncio.run(expand_bot_graph_async(seeds, use_api=args.use_api))
+    asyncio.run(expand_bot_graph_async(seeds, use_api=args.use_api, concurrency=args.concurrency))
@@ -3,26 +3,42 @@
 
 import argparse
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, UTC
 
+from app.utils.clients import get_thread_youtube
 from app.youtube_api.fetch_comment_threads_by_video_id import fetch_comment_threads_by_video_id
 from app.pipeline.trending.load import main as load_trending
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
 LOGGER = logging.getLogger(__name__)
 
+# Videos whose comment threads are fetched concurrently
+DEFAULT_WORKERS = 8
 
-def main(region: str, category: str, date: str, max_pages: int, max_comment_pages: int) -> None:
-    """Fetch comments for all videos from trending."""
+
+def main(
+    region: str,
+    category: str,
+    date: str,
+    max_pages: int,
+    max_comment_pages: int,
+    workers: int = DEFAULT_WORKERS
+) -> None:
+    """Fetch comments for all videos from trending, several videos at a time."""
     videos = load_trending(region, category, date, max_pages)
-    
-    for idx, item in enumerate(videos, start=1):
-        vid = item.get("id")
-        if not vid:
-            continue
-            
-        LOGGER.info(f"🗨️ Fetching comments for video {idx}/{len(videos)}: {vid}")
-        fetch_comment_threads_by_video_id(vid, dry_run=False, max_api_calls=max_comment_pages)
+    video_ids = [vid for vid in (item.get("id") for item in videos) if vid]
+    total = len(video_ids)
+
+    def fetch_one(numbered: tuple[int, str]) -> None:
+        idx, vid = numbered
+        LOGGER.info(f"🗨️ Fetching comments for video {idx}/{total}: {vid}")
+        fetch_comment_threads_by_video_id(
+            vid, dry_run=False, max_api_calls=max_comment_pages, youtube=get_thread_youtube()
+        )
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        list(pool.map(fetch_one, enumerate(video_ids, start=1)))
 
 
 if __name__ == "__main__":
@@ -35,6 +51,8 @@ if __name__ == "__main__":
                         help="Maximum number of trending pages to process")
     parser.add_argument("--max-comment-pages", type=int, default=2,
                         help="Maximum number of comment pages per video")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help="Number of videos fetched concurrently")
     
     args = parser.parse_args()
-    main(args.region, args.category, args.date, args.max_pages, args.max_comment_pages)
+    main(args.region, args.category, args.date, args.max_pages, args.max_comment_pages, args.workers)
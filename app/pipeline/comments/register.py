@@ -41,10 +41,11 @@ def main(
     concurrency: int,
     batch_size: int,
     queue_size: int,
-    like_threshold: int
+    like_threshold: int,
+    classify_concurrency: int
 ) -> None:
     """Register commenter channels from comment JSONs in GCS."""
-    gcs_paths = [p for p in list_gcs_files(BUCKET, COMMENTS_PREFIX) if p.endswith(".json")]
+    gcs_paths = list_gcs_files(BUCKET, COMMENTS_PREFIX, suffix=".json")
     LOGGER.info(f"📂 Found {len(gcs_paths)} comment JSONs under prefix {COMMENTS_PREFIX}")
 
     if not gcs_paths:
@@ -63,6 +64,9 @@ def main(
         manifest_path=MANIFEST_PATH,
         force=force,
         resume=resume,
+        concurrency=concurrency,
+        queue_size=queue_size,
+        classify_concurrency=classify_concurrency,
     ))
 
 
@@ -110,6 +114,12 @@ if __name__ == "__main__":
         default=int(os.getenv("REGISTER_COMMENTERS_QSIZE", "2000")),
         help="Processing queue size"
     )
+    parser.add_argument(
+        "--classify-concurrency",
+        type=int,
+        default=int(os.getenv("REGISTER_COMMENTERS_CLASSIFY_CONCURRENCY", "2")),
+        help="Number of avatar batches classified concurrently"
+    )
     parser.add_argument(
         "--like-threshold",
         type=int,
@@ -132,5 +142,6 @@ if __name__ == "__main__":
         concurrency=args.concurrency,
         batch_size=args.batch_size,
         queue_size=args.queue_size,
-        like_threshold=args.like_threshold
+        like_threshold=args.like_threshold,
+        classify_concurrency=args.classify_concurrency
     )
@@ -2,22 +2,36 @@
 
 Features:
 - Manifest-based resumability (GCS manifest: completed & in_progress)
-- Streaming parse of large JSONs using ijson (low memory)
-- Sequential processing with single Playwright browser
-- Batched Firestore commits (default 100)
-- Avatar classification and bot detection
+- Processed commenter IDs persisted next to the manifest across restarts
+- Event-level ijson parse of comment JSONs (no per-thread dicts)
+- Comment files streamed from GCS, the next one parsed while the current one is processed
+- Bounded pool of concurrent workers sharing one Playwright browser
+- Firestore writes through a BulkWriter (pipelined, rate-limited, retried)
+- Batched avatar classification and bot detection
 - About page scraping for external links and featured channels
 """
 
 import asyncio
 import logging
-from datetime import datetime
-from typing import Optional, Set, List
+import posixpath
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Iterator, Optional, Set, List, Tuple
 
+import httpx
 import ijson
-from google.cloud import firestore, storage
-
-from app.utils.image_processing import classify_avatar_url, get_xgb_model
+from google.cloud import firestore
+
+from app.utils.clients import get_firestore, get_gcs
+from app.utils.firestore_utils import make_bulk_writer
+from app.utils.image_processing import (
+    classify_avatar_bytes,
+    classify_avatar_url,
+    get_xgb_model,
+    upgrade_avatar_url,
+)
+from app.utils.gcs_utils import read_id_set, write_id_set
 from app.utils.manifest_utils import ManifestManager
 from app.pipeline.channels.scraping import PlaywrightContext, scrape_about_page, expand_bot_graph_async
 
@@ -26,131 +40,182 @@ logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
 
 COLLECTION_NAME = "channel"
 
+# Completed files between manifest uploads
+MANIFEST_SAVE_EVERY = 10
 
-# ============================================================================
-# Storage Client Helper
-# ============================================================================
+# Navigation timeout per About-page attempt, so all three attempts fit in the cap below
+ABOUT_GOTO_TIMEOUT_MS = 20_000
 
-def _storage_client() -> storage.Client:
-    """Get Google Cloud Storage client.
-    
-    Returns:
-        Initialized storage client
-    """
-    return storage.Client()
+# Upper bound on one About-page scrape: three attempts of navigation, the 15s
+# ready wait and the 3s backoff (~114s), plus the scrape itself
+ABOUT_SCRAPE_TIMEOUT = 130
+
+# Avatars classified together in one batched model call
+AVATAR_BATCH_SIZE = 32
+
+# Channel docs fetched per backfill page, and concurrent backfill classifications
+BACKFILL_PAGE_SIZE = 500
+BACKFILL_WORKERS = 16
+
+# Gzipped newline-separated commenter IDs, stored next to the manifest
+SEEN_COMMENTERS_BLOB = "seen_commenters.txt.gz"
 
 
 # ============================================================================
 # Comment Parsing
 # ============================================================================
 
-def _iter_comment_items_from_gcs(bucket: str, blob_path: str):
-    """Incrementally yield comment thread items from a GCS JSON file.
+# ijson prefixes of the top-level comment fields we read from each thread
+_THREAD_PREFIX = "items.item"
+_COMMENT_PREFIX = "items.item.snippet.topLevelComment.snippet"
+_AUTHOR_ID_PREFIX = f"{_COMMENT_PREFIX}.authorChannelId.value"
+_LIKE_COUNT_PREFIX = f"{_COMMENT_PREFIX}.likeCount"
+_AVATAR_PREFIX = f"{_COMMENT_PREFIX}.authorProfileImageUrl"
+
+
+# Bytes fetched per ranged read while streaming a comment file
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+def _iter_commenters(fp: BinaryIO) -> Iterator[Tuple[Optional[str], int, Optional[str]]]:
+    """Yield top-level commenters from a commentThreads JSON document.
     
-    Uses ijson to avoid loading the full JSON into memory. Yields each item
-    in the top-level 'items' array of a commentThreads response.
+    Walks ijson parse events and keeps only the three leaf fields needed,
+    so thread dicts (replies, text, moderation fields, ...) are never built.
+    ijson picks its C (yajl2_c) backend automatically when available; numbers
+    are parsed as floats rather than Decimals since only like counts are read.
     
     Args:
-        bucket: GCS bucket name
-        blob_path: Path to comment JSON file in bucket
+        fp: Binary file-like object holding commentThreads JSON
         
     Yields:
-        Individual comment thread objects from the 'items' array
+        (author channel ID or None, like count, author avatar URL or None)
+        per item in the 'items' array
     """
-    client = _storage_client()
-    blob = client.bucket(bucket).blob(blob_path)
-    with blob.open("rb") as f:
-        for obj in ijson.items(f, "items.item"):
-            yield obj
-
-
-# ============================================================================
-# Firestore Batching
-# ============================================================================
-
-class _Batcher:
-    """Async-friendly Firestore batcher with automatic commits.
+    # Every parse event is compared against these, so read them as locals
+    author_id_prefix, like_count_prefix = _AUTHOR_ID_PREFIX, _LIKE_COUNT_PREFIX
+    avatar_prefix, thread_prefix = _AVATAR_PREFIX, _THREAD_PREFIX
+
+    cid, likes, avatar_url = None, 0, None
+    for prefix, event, value in ijson.parse(fp, use_float=True):
+        if prefix == author_id_prefix:
+            cid = value
+        elif prefix == like_count_prefix:
+            likes = int(value or 0)
+        elif prefix == avatar_prefix:
+            avatar_url = value
+        elif prefix == thread_prefix and event == "end_map":
+            yield cid, likes, avatar_url
+            cid, likes, avatar_url = None, 0, None
+
+
+def _read_commenters(
+    bucket: str,
+    blob_path: str,
+    like_threshold: int
+) -> List[Tuple[str, Optional[str]]]:
+    """Stream a comment file from GCS and collect commenters above the like threshold.
     
-    Batches Firestore write operations and commits them when the batch
-    size is reached. Thread-safe for async usage.
-    """
+    The blob is parsed as it downloads, so only STREAM_CHUNK_SIZE bytes of
+    the file are held in memory at a time.
     
-    def __init__(self, client: firestore.Client, batch_size: int = 100) -> None:
-        """Initialize the batcher.
-        
-        Args:
-            client: Firestore client instance
-            batch_size: Number of operations before auto-commit
-        """
-        self.client = client
-        self.batch_size = batch_size
-        self._batch = self.client.batch()
-        self._count = 0
-        self._lock = asyncio.Lock()
-
-    async def set(self, doc_ref, data: dict, merge: bool = False) -> None:
-        """Add a set operation to the batch.
+    Args:
+        bucket: GCS bucket name
+        blob_path: Path to comment JSON file in bucket
+        like_threshold: Minimum likes required to include a commenter
         
-        Args:
-            doc_ref: Firestore document reference
-            data: Data to set
-            merge: Whether to merge with existing data
-        """
-        async with self._lock:
-            self._batch.set(doc_ref, data, merge=merge)
-            self._count += 1
-            if self._count >= self.batch_size:
-                await self._commit_locked()
-
-    async def _commit_locked(self) -> None:
-        """Commit the current batch (must hold lock).
+    Returns:
+        List of (channel ID, avatar URL) tuples, possibly with duplicates
+    """
+    blob = get_gcs().bucket(bucket).blob(blob_path)
+    with blob.open("rb", chunk_size=STREAM_CHUNK_SIZE) as fp:
+        return [
+            (cid, avatar_url)
+            for cid, likes, avatar_url in _iter_commenters(fp)
+            if cid and likes >= like_threshold
+        ]
+
+
+def _collect_candidates(
+    commenters: List[Tuple[str, Optional[str]]],
+    seen: Set[str]
+) -> List[Tuple[str, Optional[str]]]:
+    """Collect unique, not-yet-seen commenters.
+    
+    Args:
+        commenters: (channel ID, avatar URL) tuples read from one file
+        seen: Channel IDs already collected this run (updated in place)
         
-        Creates a new batch for subsequent operations.
-        """
-        batch = self._batch
-        self._batch = self.client.batch()
-        self._count = 0
-        await asyncio.to_thread(batch.commit)
-
-    async def flush(self) -> None:
-        """Flush any remaining operations in the batch."""
-        async with self._lock:
-            if self._count > 0:
-                await self._commit_locked()
+    Returns:
+        List of (channel ID, avatar URL) tuples
+    """
+    candidates = []
+    add_seen, add_candidate = seen.add, candidates.append
+    for cid, avatar_url in commenters:
+        if cid in seen:
+            continue
+        add_seen(cid)
+        add_candidate((cid, avatar_url))
+    return candidates
 
 
 # ============================================================================
-# Data Extraction Helpers
+# Avatar Downloads
 # ============================================================================
 
-def _extract_channel_id_from_thread(thread: dict) -> Optional[str]:
-    """Extract commenter channel ID from comment thread.
+# Avatar size requested from the image CDN for classification
+AVATAR_FETCH_SIZE = 128
+
+
+async def _fetch_avatar(http: httpx.AsyncClient, url: Optional[str]) -> Optional[bytes]:
+    """Download an avatar at AVATAR_FETCH_SIZE, falling back to the original URL.
     
     Args:
-        thread: Comment thread object from YouTube API
+        http: Shared async HTTP client (keep-alive connections)
+        url: Avatar URL from the comment snippet
         
     Returns:
-        Channel ID or None if not found
+        Raw image bytes, or None if both downloads fail
     """
-    try:
-        return thread["snippet"]["topLevelComment"]["snippet"]["authorChannelId"]["value"]
-    except Exception:
+    if not url:
         return None
+    for candidate in (upgrade_avatar_url(url, size=AVATAR_FETCH_SIZE), url):
+        try:
+            resp = await http.get(candidate)
+            if resp.status_code == 200 and resp.content:
+                return resp.content
+        except httpx.HTTPError:
+            continue
+    return None
+
 
+# ============================================================================
+# Processed Commenters
+# ============================================================================
+
+def _seen_commenters_path(manifest_path: str) -> str:
+    """Return the GCS path of the processed-commenters blob for a manifest."""
+    return posixpath.join(posixpath.dirname(manifest_path), SEEN_COMMENTERS_BLOB)
 
-def _extract_like_count_from_thread(thread: dict) -> int:
-    """Extract like count from comment thread.
+
+# ============================================================================
+# Existence Checks
+# ============================================================================
+
+async def _load_existing_ids(adb: firestore.AsyncClient) -> Set[str]:
+    """Load the IDs of all registered channels in one streaming query.
+    
+    The select([]) projection returns document IDs only, so the payload
+    stays small even for large collections.
     
     Args:
-        thread: Comment thread object from YouTube API
+        adb: Async Firestore client
         
     Returns:
-        Like count (defaults to 0 if not found)
+        Set of existing channel IDs
     """
-    try:
-        return int(thread["snippet"]["topLevelComment"]["snippet"].get("likeCount", 0))
-    except Exception:
-        return 0
+    query = adb.collection(COLLECTION_NAME).select([])
+    return {snap.id async for snap in query.stream()}
 
 
 # ============================================================================
@@ -205,12 +270,22 @@ async def register_commenter_channels(
     resume: bool = True,
     expand_for_review: bool = True,
     use_api_for_expansion: bool = True,
+    concurrency: int = 8,
+    queue_size: int = 2000,
+    classify_concurrency: int = 2,
 ) -> None:
     """Register commenter channels from GCS comment JSON files.
     
-    Sequential processing of comment files using a single Playwright browser.
-    Extracts channels from comments, classifies avatars, scrapes About pages,
-    and registers channels in Firestore.
+    Files are read one at a time and the new commenters from each file flow
+    through a staged pipeline connected by bounded queues:
+    
+    - classify: `classify_concurrency` workers score avatars in batches of
+      AVATAR_BATCH_SIZE and drop default avatars
+    - scrape: `concurrency` workers scrape About pages (sharing one
+      Playwright browser) and stage channel documents
+    - write: a BulkWriter sends staged documents from its own threads
+    
+    so classification, scraping and writes overlap instead of adding up.
     
     Args:
         bucket: GCS bucket name
@@ -222,12 +297,24 @@ async def register_commenter_channels(
         resume: If True, skip files marked as completed in manifest
         expand_for_review: If True, expand discovered channels for manual review
         use_api_for_expansion: If True, use YouTube API during expansion
+        concurrency: Number of commenters processed concurrently
+        queue_size: Maximum commenters buffered ahead of the workers
+        classify_concurrency: Number of avatar batches classified concurrently
     """
-    db = firestore.Client()
+    db = get_firestore()
+    # Created per run: the async client binds to the running event loop
+    adb = firestore.AsyncClient()
     model = get_xgb_model()
+    existing_ids = await _load_existing_ids(adb)
+    LOGGER.info(f"📚 Loaded {len(existing_ids)} existing channel IDs")
 
     # Use ManifestManager instead of manual manifest functions
-    manifest_manager = ManifestManager(bucket=bucket, manifest_path=manifest_path)
+    manifest_manager = ManifestManager(
+        bucket=bucket,
+        manifest_path=manifest_path,
+        storage_client=get_gcs(),
+        save_every=MANIFEST_SAVE_EVERY,
+    )
     
     if force:
         manifest_manager.reset()
@@ -242,89 +329,229 @@ async def register_commenter_channels(
         len(remaining), len(completed), force, resume
     )
 
-    total_new = 0
-    seen_this_run: Set[str] = set()
-    new_channels: List[str] = []  # Track newly added channels for expansion
-    batcher = _Batcher(db, batch_size=100)
-
-    async with PlaywrightContext() as context:
-        for idx, gcs_path in enumerate(remaining, start=1):
-            LOGGER.info(f"📥 [{idx}/{len(remaining)}] Processing file: {gcs_path}")
-            manifest_manager.mark_in_progress(gcs_path)
+    # Commenters fully handled by earlier runs (registered or rejected) are
+    # skipped before the existence check, classification and scraping
+    seen_path = _seen_commenters_path(manifest_path)
+    processed: Set[str] = (
+        set() if force else await asyncio.to_thread(read_id_set, bucket, seen_path)
+    )
+    saved_processed = len(processed)
+    LOGGER.info(f"🧠 Loaded {saved_processed} previously processed commenters")
 
-            for thread in _iter_comment_items_from_gcs(bucket, gcs_path):
-                cid = _extract_channel_id_from_thread(thread)
-                if not cid:
-                    continue
-                if _extract_like_count_from_thread(thread) < like_threshold:
-                    continue
-                if cid in seen_this_run:
-                    continue
-                seen_this_run.add(cid)
+    async def save_processed() -> None:
+        nonlocal saved_processed
+        if len(processed) != saved_processed:
+            snapshot = set(processed)
+            await asyncio.to_thread(write_id_set, bucket, seen_path, snapshot)
+            LOGGER.debug(f"Saved {len(snapshot)} seen commenters to {seen_path}")
+            saved_processed = len(snapshot)
 
-                doc_ref = db.collection(COLLECTION_NAME).document(cid)
-                LOGGER.info(f"🔍 Checking if {cid} already exists in Firestore...")
-                exists = await asyncio.to_thread(lambda: doc_ref.get().exists)
-                if exists:
-                    LOGGER.info(f"⏭️ Skipping {cid} - already exists")
-                    continue
+    total_new = 0
+    stats: Counter = Counter()  # Per-file outcome counts, logged once per file
+    seen_this_run: Set[str] = set(processed)
+    new_channels: List[str] = []  # Track newly added channels for expansion
+    # Commenters whose channel doc was staged for the current file
+    staged: Set[str] = set()
+    # Commenters whose channel doc write committed, filled from the BulkWriter's threads
+    committed: Set[str] = set()
+    committed_lock = threading.Lock()
+    writer = make_bulk_writer(db)
+
+    def _on_write_result(doc_ref, _result, _writer) -> None:
+        with committed_lock:
+            committed.add(doc_ref.id)
+
+    writer.on_write_result(_on_write_result)
+
+    def take_committed() -> Set[str]:
+        """Return and clear the commenters whose writes committed so far."""
+        with committed_lock:
+            done = set(committed)
+            committed.clear()
+        return done
+    channel_col = db.collection(COLLECTION_NAME)
+    classify_queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, classify_concurrency) * 2)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, queue_size))
+
+    async def classify_batch(
+        http: httpx.AsyncClient,
+        batch: List[Tuple[str, Optional[str]]]
+    ) -> List[Tuple[str, dict]]:
+        """Classify a batch of commenter avatars; MISSING for all on failure."""
+        LOGGER.debug("🖼️ Classifying %d avatars...", len(batch))
+        try:
+            contents = await asyncio.gather(*(_fetch_avatar(http, url) for _, url in batch))
+            # Decode + model inference block, so keep them off the loop
+            return await asyncio.to_thread(classify_avatar_bytes, contents, model=model)
+        except Exception as e:
+            LOGGER.warning(f"⚠️ Avatar batch classification failed: {e}")
+            return [("MISSING", {})] * len(batch)
+
+    async def register_one(
+        context: PlaywrightContext,
+        cid: str,
+        avatar_url: Optional[str],
+        label: str,
+        metrics: dict,
+    ) -> bool:
+        """Scrape and stage one classified commenter.
+        
+        Returns True only when the About page loaded and has no links, i.e.
+        the commenter is done without a write. Staged writes are recorded in
+        `staged` and count as processed once the BulkWriter commits them;
+        failed scrapes (the strict scrape raises on navigation/load failures)
+        are counted so the file is left incomplete and re-read next run.
+        """
+        nonlocal total_new
+        LOGGER.debug("🆕 Scraping About page for %s (avatar: %s)", cid, label)
 
-                LOGGER.info(f"🆕 Processing new channel {cid}")
-                avatar_url = (
-                    thread.get("snippet", {})
-                    .get("topLevelComment", {})
-                    .get("snippet", {})
-                    .get("authorProfileImageUrl")
+        try:
+            async with context.pages.acquire() as page:
+                about_links, subs = await asyncio.wait_for(
+                    scrape_about_page(page, cid, strict=True, goto_timeout_ms=ABOUT_GOTO_TIMEOUT_MS),
+                    timeout=ABOUT_SCRAPE_TIMEOUT,
                 )
+            LOGGER.debug("📊 Found %d links and %d subs for %s", len(about_links), len(subs), cid)
+        except Exception as e:
+            LOGGER.warning(f"⚠️ scrape_about_page failed for {cid}: {e}")
+            stats["failed"] += 1
+            await asyncio.sleep(1)
+            return False
+
+        if not about_links and not subs:
+            LOGGER.debug("⏭️ Skipping %s - no links or subs found", cid)
+            stats["no_links"] += 1
+            return True
+
+        data = {
+            "channel_id": cid,
+            "avatar_url": avatar_url,
+            "avatar_label": label,
+            "avatar_metrics": metrics,
+            "about_links_count": len(about_links),
+            "featured_channels_count": len(subs),
+            "is_screenshot_stored": False,
+            "is_bot_checked": False,
+            "registered_at": firestore.SERVER_TIMESTAMP,
+            "source": "register-commenters",
+        }
+        writer.set(channel_col.document(cid), data, merge=True)
+        staged.add(cid)
+        existing_ids.add(cid)
+        new_channels.append(cid)  # Track for expansion
+        total_new += 1
+        stats["saved"] += 1
+        LOGGER.debug("✅ Added %s", cid)
+        return False
 
-                label, metrics = "MISSING", {}
-                if avatar_url:
-                    try:
-                        LOGGER.info(f"🖼️ Classifying avatar for {cid}...")
-                        label, metrics = classify_avatar_url(avatar_url, size=128, model=model)
-                        if label == "DEFAULT":
-                            LOGGER.info(f"🚫 Skipping default avatar {cid}")
-                            continue
-                        LOGGER.info(f"✅ Avatar classified as {label} for {cid}")
-                    except Exception as e:
-                        LOGGER.warning(f"⚠️ Avatar classification failed for {cid}: {e}")
-
-                try:
-                    LOGGER.info(f"🌐 Scraping About page for {cid}...")
-                    about_links, subs = await scrape_about_page(context, cid)
-                    LOGGER.info(f"📊 Found {len(about_links)} links and {len(subs)} subs for {cid}")
-                except Exception as e:
-                    LOGGER.warning(f"⚠️ scrape_about_page failed for {cid}: {e}")
-                    about_links, subs = [], []
-                    await asyncio.sleep(1)
-
-                if not about_links and not subs:
-                    LOGGER.info(f"⏭️ Skipping {cid} - no links or subs found")
-                    continue
+    async def classify_worker(context: PlaywrightContext) -> None:
+        while True:
+            batch = await classify_queue.get()
+            try:
+                results = await classify_batch(context.http, batch)
+                for (cid, avatar_url), (label, metrics) in zip(batch, results):
+                    if label == "DEFAULT":
+                        LOGGER.debug("🚫 Skipping default avatar %s", cid)
+                        stats["default"] += 1
+                        processed.add(cid)
+                        continue
+                    await queue.put((cid, avatar_url, label, metrics))
+            except Exception as e:
+                LOGGER.exception(f"💥 Unexpected error classifying batch: {e}")
+            finally:
+                classify_queue.task_done()
+
+    async def worker(context: PlaywrightContext) -> None:
+        while True:
+            cid, avatar_url, label, metrics = await queue.get()
+            try:
+                if await register_one(context, cid, avatar_url, label, metrics):
+                    processed.add(cid)
+            except Exception as e:
+                LOGGER.exception(f"💥 Unexpected error for {cid}: {e}")
+            finally:
+                queue.task_done()
+
+    async with PlaywrightContext(max_pages=concurrency) as context:
+        workers = [asyncio.create_task(worker(context)) for _ in range(max(1, concurrency))]
+        workers += [asyncio.create_task(classify_worker(context)) for _ in range(max(1, classify_concurrency))]
+
+        def prefetch(i: int) -> Optional[asyncio.Task]:
+            # At most one file is streamed and parsed ahead of the current one
+            if i >= len(remaining):
+                return None
+            return asyncio.create_task(
+                asyncio.to_thread(_read_commenters, bucket, remaining[i], like_threshold)
+            )
+
+        next_download = prefetch(0)
+        try:
+            for idx, gcs_path in enumerate(remaining, start=1):
+                LOGGER.info(f"📥 [{idx}/{len(remaining)}] Processing file: {gcs_path}")
+                manifest_manager.mark_in_progress(gcs_path)
+                stats.clear()
+                commenters = await next_download
+                next_download = prefetch(idx)
+
+                # Pass 1: keep unique commenters not yet seen this run
+                candidates = _collect_candidates(commenters, seen_this_run)
+                del commenters
+
+                # Pass 2: drop channels already in Firestore (checked locally)
+                new = [(cid, url) for cid, url in candidates if cid not in existing_ids]
+                LOGGER.info(
+                    f"🔍 {len(candidates)} candidate commenters, "
+                    f"{len(candidates) - len(new)} already exist"
+                )
 
-                LOGGER.info(f"💾 Saving {cid} to Firestore...")
-                data = {
-                    "channel_id": cid,
-                    "avatar_url": avatar_url,
-                    "avatar_label": label,
-                    "avatar_metrics": metrics,
-                    "about_links_count": len(about_links),
-                    "featured_channels_count": len(subs),
-                    "is_screenshot_stored": False,
-                    "is_bot_checked": False,
-                    "registered_at": datetime.now(),
-                    "source": "register-commenters",
-                }
-                await batcher.set(doc_ref, data, merge=True)
-                new_channels.append(cid)  # Track for expansion
-                LOGGER.info(f"✅ Successfully registered {cid}")
-                total_new += 1
-                LOGGER.info(f"✅ Added {cid}")
-
-            manifest_manager.mark_completed(gcs_path)
-            LOGGER.info(f"✅ Completed file: {gcs_path}")
-
-    await batcher.flush()
+                # Pass 3: feed avatar batches into the pipeline (blocks when
+                # the classify queue is full), then drain it stage by stage
+                for start in range(0, len(new), AVATAR_BATCH_SIZE):
+                    await classify_queue.put(new[start:start + AVATAR_BATCH_SIZE])
+                await classify_queue.join()
+                await queue.join()
+
+                # Make the file's writes durable before marking it done; only
+                # commenters whose writes committed count as processed
+                await asyncio.to_thread(writer.flush)
+                landed = take_committed()
+                processed.update(landed)
+                stats["dropped"] = len(staged - landed)
+                staged.clear()
+
+                # Failed scrapes and dropped writes aren't in `processed`, so
+                # leaving the file incomplete makes the next run re-read it and
+                # retry exactly those commenters
+                if stats["failed"] or stats["dropped"]:
+                    LOGGER.warning(
+                        f"⚠️ Leaving {gcs_path} incomplete: {stats['failed']} failed scrapes, "
+                        f"{stats['dropped']} dropped writes will be retried next run"
+                    )
+                else:
+                    manifest_manager.mark_completed(gcs_path)
+                # Same cadence as the manifest upload above, so seen commenters
+                # are saved alongside the files they came from
+                if idx % MANIFEST_SAVE_EVERY == 0:
+                    await save_processed()
+                LOGGER.info(
+                    f"✅ Finished file: {gcs_path} (saved {stats['saved']}, "
+                    f"default avatar {stats['default']}, no links {stats['no_links']}, "
+                    f"failed {stats['failed']}, dropped {stats['dropped']})"
+                )
+        finally:
+            if next_download:
+                next_download.cancel()
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            # Persist marks batched since the last upload, even on interrupt
+            await asyncio.to_thread(manifest_manager.flush)
+            # Only persist commenter IDs once their pending writes have committed
+            await asyncio.to_thread(writer.flush)
+            processed.update(take_committed())
+            await save_processed()
+
+    await asyncio.to_thread(writer.close)
     LOGGER.info(f"🎉 Done! New channels this run: {total_new}")
     
     # Expand newly discovered channels for manual review
@@ -336,113 +563,81 @@ async def register_commenter_channels(
         )
 
 
-async def _init_channel_doc(
-    context: PlaywrightContext,
-    batch,
-    db: firestore.Client,
-    cid: str,
-    avatar_url: Optional[str],
-    model
-) -> bool:
-    """Initialize a channel document with avatar classification and About page data.
-    
-    Helper function for processing individual channels (legacy, kept for compatibility).
+def _backfill_one(snap, model) -> Optional[Tuple[str, dict]]:
+    """Reclassify one channel's avatar if it still lacks a bot probability.
     
     Args:
-        context: Playwright context for scraping
-        batch: Firestore batch for writes
-        db: Firestore client
-        cid: Channel ID
-        avatar_url: URL to channel avatar image
-        model: XGBoost model for avatar classification
+        snap: Channel document snapshot
+        model: XGBoost model passed through to classification
         
     Returns:
-        True if channel was added, False if skipped
+        (avatar label, merged avatar metrics), or None if nothing to update
     """
-    doc_ref = db.collection(COLLECTION_NAME).document(cid)
-    if doc_ref.get().exists:
-        return False
-
-    # Process avatar
-    label = "MISSING"
-    metrics = {}
-    if avatar_url:
-        try:
-            label, metrics = classify_avatar_url(avatar_url, size=128, model=model)
-            if label == "DEFAULT":
-                LOGGER.info(f"🚫 Skipping default avatar {cid}")
-                return False
-        except Exception as e:
-            LOGGER.warning(f"⚠️ Avatar classification failed for {cid}: {e}")
-
-    # Scrape links and featured channels
-    about_links, subs = await scrape_about_page(context, cid)
+    doc = snap.to_dict() or {}
+    metrics = doc.get("avatar_metrics", {})
+    if not metrics or metrics.get("has_bot_probability"):
+        return None
 
-    if not about_links and not subs:
-        LOGGER.info(f"⏭️ Skipping https://www.youtube.com/channel/{cid} — no links or featured channels found")
-        return False
+    avatar_url = doc.get("avatar_url")
+    if not avatar_url:
+        return None
 
-    # Store channel
-    batch.set(doc_ref, {
-        "channel_id": cid,
-        "avatar_url": avatar_url,
-        "avatar_label": label,
-        "avatar_metrics": metrics,
-        "about_links_count": len(about_links),
-        "featured_channels_count": len(subs),
-        "is_screenshot_stored": False,
-        "is_bot_checked": False,
-        "registered_at": datetime.now(),
-    })
-    return True
+    try:
+        label, new_metrics = classify_avatar_url(avatar_url, size=128, model=model)
+    except Exception as e:
+        LOGGER.warning(f"⚠️ Failed to backfill {snap.id}: {e}")
+        return None
+    metrics.update(new_metrics)
+    metrics["has_bot_probability"] = True
+    return label, metrics
 
 
 def backfill_bot_probabilities(limit: int = 5000) -> None:
     """Recompute bot_probability for existing channels missing it.
     
     Backfills avatar metrics and bot probabilities for channels that
-    were registered before the XGBoost model was available.
+    were registered before the XGBoost model was available. Channels are
+    scanned in pages of BACKFILL_PAGE_SIZE (resuming after the last document
+    rather than holding one long cursor), classified on a thread pool, and
+    updated through a BulkWriter.
     
     Args:
         limit: Maximum number of channels to process
     """
-    db = firestore.Client()
+    db = get_firestore()
     model = get_xgb_model()
-    snaps = db.collection(COLLECTION_NAME).limit(limit).stream()
-
-    batch = db.batch()
-    updated = 0
-
-    for snap in snaps:
-        doc = snap.to_dict() or {}
-        metrics = doc.get("avatar_metrics", {})
-        if not metrics or metrics.get("has_bot_probability"):
-            continue
-
-        avatar_url = doc.get("avatar_url")
-        if not avatar_url:
-            continue
-
-        try:
-            label, new_metrics = classify_avatar_url(avatar_url, size=128, model=model)
-            metrics.update(new_metrics)
-            metrics["has_bot_probability"] = True
-            doc_ref = db.collection(COLLECTION_NAME).document(snap.id)
-            batch.update(doc_ref, {"avatar_metrics": metrics, "avatar_label": label})
-            updated += 1
-
-            if updated % 100 == 0:
-                batch.commit()
-                batch = db.batch()
-                LOGGER.info(f"✅ Updated {updated} so far...")
-        except Exception as e:
-            LOGGER.warning(f"⚠️ Failed to backfill {snap.id}: {e}")
+    # Only channels flagged as unscored, and only the two fields read here
+    pending = (
+        db.collection(COLLECTION_NAME)
+        .where("avatar_metrics.has_bot_probability", "==", False)
+        .select(["avatar_metrics", "avatar_url"])
+    )
+    writer = make_bulk_writer(db)
+    scanned = updated = 0
+    last_snap = None
+
+    with ThreadPoolExecutor(max_workers=BACKFILL_WORKERS) as pool:
+        while scanned < limit:
+            query = pending.order_by("__name__").limit(min(BACKFILL_PAGE_SIZE, limit - scanned))
+            if last_snap is not None:
+                query = query.start_after(last_snap)
+            snaps = list(query.stream())
+            if not snaps:
+                break
+            scanned += len(snaps)
+            last_snap = snaps[-1]
+
+            for snap, result in zip(snaps, pool.map(lambda s: _backfill_one(s, model), snaps)):
+                if result is None:
+                    continue
+                label, metrics = result
+                writer.update(snap.reference, {"avatar_metrics": metrics, "avatar_label": label})
+                updated += 1
+            LOGGER.info(f"✅ Updated {updated} so far ({scanned} scanned)...")
 
-    if updated:
-        batch.commit()
+    writer.close()
     LOGGER.info(f"🎉 Backfill finished: {updated} channels updated with bot_probability")
 
-
 if __name__ == "__main__":
     import argparse
 
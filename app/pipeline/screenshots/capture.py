@@ -5,25 +5,23 @@ Capture YouTube channel homepage screenshots using Playwright.
 Flow:
 - Query Firestore: channels with is_screenshot_stored == False
 - Visit https://www.youtube.com/channel/{channel_id}
-- Take full-page screenshot
-- Upload to GCS: gs://<bucket>/channel_screenshots/raw/{channel_id}.png
+- Take full-page JPEG screenshot
+- Upload to GCS: gs://<bucket>/channel_screenshots/raw/{channel_id}.jpg
 - Update Firestore: {is_screenshot_stored=True, screenshot_gcs_uri=...}
 """
 
 import argparse
 import asyncio
-import io
 import logging
 import os
-import uuid
 from datetime import datetime
 from typing import List
 
-from google.cloud import firestore, storage
+from google.cloud import firestore
 from playwright.async_api import async_playwright
 
 from app.pipeline.channels.scraping import PlaywrightContext, get_channel_url
-from app.utils.gcs_utils import upload_png
+from app.utils.gcs_utils import upload_jpeg
 
 # ───── config ─────
 logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
@@ -35,7 +33,6 @@ PAGE_TIMEOUT_MS = 25_000
 
 # ───── GCP clients ─────
 _db: firestore.Client | None = None
-_storage: storage.Client | None = None
 
 
 def db() -> firestore.Client:
@@ -46,14 +43,6 @@ def db() -> firestore.Client:
     return _db
 
 
-def bucket():
-    """Get or create GCS bucket."""
-    global _storage
-    if _storage is None:
-        _storage = storage.Client()
-    return _storage.bucket(BUCKET_NAME)
-
-
 def fetch_channels_needing_screenshots(limit: int) -> List[firestore.DocumentSnapshot]:
     """Fetch Firestore docs for channels missing screenshots."""
     query = (
@@ -66,14 +55,6 @@ def fetch_channels_needing_screenshots(limit: int) -> List[firestore.DocumentSna
     return docs
 
 
-def upload_png(cid: str, png_bytes: bytes) -> str:
-    """Upload PNG to GCS and return its URI."""
-    path = f"channel_screenshots/raw/{cid}_{uuid.uuid4().hex}.png"
-    blob = bucket().blob(path)
-    blob.upload_from_file(io.BytesIO(png_bytes), content_type="image/png")
-    return f"gs://{bucket().name}/{path}"
-
-
 async def wait_for_image(page, selector: str, timeout: int = 15000) -> bool:
     """Wait for an image to fully load."""
     try:
@@ -161,7 +142,7 @@ async def save_screenshots(
                     # Exit early if channel was removed
                     if channel_removed:
                         # Mark as processed so we don't keep trying to screenshot a removed channel
-                        snap.reference.update({
+                        await asyncio.to_thread(snap.reference.update, {
                             "is_screenshot_stored": True,
                             "screenshot_gcs_uri": None,  # No screenshot available
                             "channel_status": "removed",
@@ -172,10 +153,12 @@ async def save_screenshots(
                     # At this point, #contents is already visible, so continue with screenshot
                     await page.evaluate("window.scrollBy(0, 800)")
                     await asyncio.sleep(2)
-                    png = await page.screenshot(full_page=True)
+                    jpeg = await page.screenshot(full_page=True, type="jpeg", quality=80)
 
-                    gcs_uri = upload_png(cid, png)
-                    snap.reference.update({
+                    # GCS and Firestore calls block, so keep them off the loop
+                    # while other tabs are still loading
+                    gcs_uri = await asyncio.to_thread(upload_jpeg, BUCKET_NAME, cid, jpeg)
+                    await asyncio.to_thread(snap.reference.update, {
                         "screenshot_gcs_uri": gcs_uri,
                         "is_screenshot_stored": True,
                         "is_bot_checked": False,  # Initialize for review
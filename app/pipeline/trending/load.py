@@ -3,6 +3,7 @@
 
 import argparse
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, UTC
 from typing import List, Dict, Any
 
@@ -13,15 +14,22 @@ from app.env import GCS_BUCKET_DATA
 logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
 LOGGER = logging.getLogger(__name__)
 
+# Upper bound on trending pages read from GCS concurrently
+MAX_READ_WORKERS = 16
+
 
 def main(region: str, category: str, date: str, max_pages: int) -> List[Dict[str, Any]]:
-    """Load trending videos from GCS and return them."""
+    """Load trending videos from GCS and return them (pages are read concurrently)."""
     all_videos = []
-    
-    for page in range(1, max_pages + 1):
-        path = trending_video_raw_path(region, category, page, date)
-        page_data = read_json_from_gcs(GCS_BUCKET_DATA, path)
-        
+    paths = [trending_video_raw_path(region, category, page, date) for page in range(1, max_pages + 1)]
+    if not paths:
+        return all_videos
+
+    with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(paths))) as pool:
+        pages = list(pool.map(lambda path: read_json_from_gcs(GCS_BUCKET_DATA, path), paths))
+
+    # map() keeps page order, so videos come back in the same order as before
+    for page, (path, page_data) in enumerate(zip(paths, pages), start=1):
         if not page_data:
             LOGGER.info(f"⚠️ No data found for {category} page {page}")
             continue
@@ -2,22 +2,33 @@
 
 import os
 import logging
-from google.cloud import storage, bigquery
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from google.cloud import storage, bigquery, firestore
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from typing import Optional
 from dotenv import load_dotenv
 load_dotenv()  # take environment variables from .env
 
-__all__ = ["get_gcs", "get_firestore", "get_youtube"]
+__all__ = ["get_gcs", "get_firestore", "get_youtube", "get_thread_youtube", "get_http_session"]
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 # Singleton instances
 _gcs: Optional[storage.Client] = None
+_firestore: Optional[firestore.Client] = None
 _bq: Optional[bigquery.Client] = None
 _youtube = None
+# Per-thread YouTube clients (googleapiclient/httplib2 is not thread-safe)
+_thread_clients = threading.local()
+_http_session: Optional[requests.Session] = None
+
+# Pooled keep-alive connections per host for the shared HTTP session
+HTTP_POOL_SIZE = 32
 
 # Environment variables
 GCS_BUCKET_DATA = os.getenv("GCS_BUCKET_DATA", "your-default-bucket-name")
@@ -32,6 +43,13 @@ def get_gcs() -> storage.Client:
         _gcs = storage.Client()
     return _gcs
 
+def get_firestore() -> firestore.Client:
+    global _firestore
+    if _firestore is None:
+        logger.info("Initializing Firestore client...")
+        _firestore = firestore.Client()
+    return _firestore
+
 def get_bq() -> bigquery.Client:
     global _bq
     if _bq is None:
@@ -52,3 +70,25 @@ def get_youtube():
             logger.exception("Failed to build YouTube API client.")
             raise RuntimeError(f"Failed to initialize YouTube API client: {e}")
     return _youtube
+
+def get_thread_youtube():
+    """YouTube Data API client owned by the calling thread (for worker pools)."""
+    youtube = getattr(_thread_clients, "youtube", None)
+    if youtube is None:
+        if not API_KEY:
+            raise RuntimeError("❌ API_KEY is not set in environment variables.")
+        logger.info("Initializing per-thread YouTube Data API client...")
+        youtube = build("youtube", "v3", developerKey=API_KEY)
+        _thread_clients.youtube = youtube
+    return youtube
+
+def get_http_session() -> requests.Session:
+    """Shared requests session, so image downloads reuse TLS connections."""
+    global _http_session
+    if _http_session is None:
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+        _http_session = requests.Session()
+        _http_session.mount("https://", adapter)
+        _http_session.mount("http://", adapter)
+    return _http_session
@@ -0,0 +1,45 @@
+"""Firestore write helpers shared by the pipelines."""
+
+import logging
+
+from google.cloud import firestore
+from google.cloud.firestore_v1.bulk_writer import (
+    BulkRetry,
+    BulkWriteFailure,
+    BulkWriter,
+    BulkWriterOptions,
+)
+
+__all__ = ["make_bulk_writer"]
+
+LOGGER = logging.getLogger(__name__)
+
+# Attempts before a failed BulkWriter write is given up on
+MAX_WRITE_ATTEMPTS = 5
+
+
+def make_bulk_writer(db: firestore.Client, max_attempts: int = MAX_WRITE_ATTEMPTS) -> BulkWriter:
+    """Create a BulkWriter that logs failed writes and retries them a bounded number of times.
+    
+    BulkWriter batches and sends writes from its own thread pool, so set()
+    calls return immediately instead of blocking on a commit.
+    
+    Args:
+        db: Firestore client instance
+        max_attempts: Attempts before a failed write is dropped
+        
+    Returns:
+        Configured BulkWriter
+    """
+    writer = db.bulk_writer(options=BulkWriterOptions(retry=BulkRetry.exponential))
+
+    def _on_error(failure: BulkWriteFailure, _writer: BulkWriter) -> bool:
+        retry = failure.attempts < max_attempts
+        LOGGER.warning(
+            f"⚠️ Firestore write failed for {failure.operation.reference.id} "
+            f"(attempt {failure.attempts}, retry={retry}): {failure.message}"
+        )
+        return retry
+
+    writer.on_write_error(_on_error)
+    return writer
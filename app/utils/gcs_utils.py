@@ -1,12 +1,13 @@
 """Google Cloud Storage utility functions for file operations."""
 
+import gzip
 import io
 import json
 import logging
 import uuid
-from typing import Optional, List
+from typing import Iterable, Optional, List, Set
 
-from google.cloud import storage
+from google.cloud.storage.retry import DEFAULT_RETRY
 
 from app.utils.clients import get_gcs
 
@@ -16,8 +17,12 @@ __all__ = [
     "write_json_to_gcs",
     "list_gcs_files",
     "upload_file_to_gcs",
+    "upload_bytes_to_gcs",
     "upload_png",
+    "upload_jpeg",
     "delete_gcs_file",
+    "read_id_set",
+    "write_id_set",
 ]
 
 LOGGER = logging.getLogger(__name__)
@@ -149,20 +154,29 @@ def delete_file(bucket_name: str, blob_path: str) -> None:
     LOGGER.info(f"Deleted blob: {blob_path}")
 
 
-def list_gcs_files(bucket_name: str, prefix: str = "") -> List[str]:
+def list_gcs_files(
+    bucket_name: str,
+    prefix: str = "",
+    suffix: str = "",
+    page_size: int = 1000,
+) -> List[str]:
     """List all file paths in a GCS bucket under a given prefix.
     
+    Blobs are streamed page by page and filtered as they arrive, so only
+    the matching names are kept in memory.
+    
     Args:
         bucket_name: Name of the GCS bucket
         prefix: Path prefix (e.g. "youtube-bot-dataset/video_comments/raw/")
+        suffix: Only return paths ending with this (e.g. ".json")
+        page_size: Blobs fetched per list request
         
     Returns:
         List of file paths (strings) relative to the bucket
     """
-    client = storage.Client()
-    bucket = client.bucket(bucket_name)
-    blobs = bucket.list_blobs(prefix=prefix)
-    return [blob.name for blob in blobs]
+    bucket = gcs.bucket(bucket_name)
+    blobs = bucket.list_blobs(prefix=prefix, page_size=page_size)
+    return [blob.name for blob in blobs if blob.name.endswith(suffix)]
 
 
 def upload_file_to_gcs(
@@ -227,7 +241,9 @@ def upload_bytes_to_gcs(
     if cache_control:
         blob.cache_control = cache_control
         
-    blob.upload_from_string(data, content_type=content_type)
+    # Re-uploading the same bytes is idempotent, so retry transient failures
+    # (the library default only retries uploads with a generation precondition)
+    blob.upload_from_string(data, content_type=content_type, retry=DEFAULT_RETRY)
     
     if cache_control:
         blob.patch()
@@ -250,4 +266,55 @@ def upload_png(bucket_name: str, cid: str, png_bytes: bytes) -> str:
     bucket = gcs.bucket(bucket_name)
     blob = bucket.blob(path)
     blob.upload_from_file(io.BytesIO(png_bytes), content_type="image/png")
-    return f"gs://{bucket_name}/{path}"
\ No newline at end of file
+    return f"gs://{bucket_name}/{path}"
+
+
+def upload_jpeg(bucket_name: str, cid: str, jpeg_bytes: bytes) -> str:
+    """Upload a JPEG screenshot to GCS.
+    
+    Args:
+        bucket_name: Name of the GCS bucket
+        cid: Channel ID
+        jpeg_bytes: Raw JPEG image bytes
+        
+    Returns:
+        The gs:// URI of the uploaded file
+    """
+    path = f"channel_screenshots/raw/{cid}_{uuid.uuid4().hex}.jpg"
+    bucket = gcs.bucket(bucket_name)
+    blob = bucket.blob(path)
+    blob.upload_from_file(io.BytesIO(jpeg_bytes), content_type="image/jpeg")
+    return f"gs://{bucket_name}/{path}"
+
+
+def read_id_set(bucket_name: str, blob_path: str) -> Set[str]:
+    """Load a set of IDs stored as a gzipped newline-separated list.
+    
+    Args:
+        bucket_name: Name of the GCS bucket
+        blob_path: Path to the gzipped ID list in bucket
+        
+    Returns:
+        Set of IDs (empty if the blob doesn't exist or can't be read)
+    """
+    blob = gcs.bucket(bucket_name).blob(blob_path)
+    if not blob.exists():
+        return set()
+    try:
+        text = gzip.decompress(blob.download_as_bytes()).decode("utf-8")
+    except Exception as e:
+        LOGGER.warning(f"Failed to load ID set {blob_path}: {e}")
+        return set()
+    return set(filter(None, text.split("\n")))
+
+
+def write_id_set(bucket_name: str, blob_path: str, ids: Iterable[str]) -> None:
+    """Upload IDs as a gzipped newline-separated list (read back with read_id_set).
+    
+    Args:
+        bucket_name: Name of the GCS bucket
+        blob_path: Destination path in bucket
+        ids: IDs to persist
+    """
+    payload = gzip.compress("\n".join(sorted(ids)).encode("utf-8"))
+    upload_bytes_to_gcs(bucket_name, blob_path, payload, content_type="application/gzip")
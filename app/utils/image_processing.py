@@ -1,11 +1,16 @@
-import re, cv2, numpy as np, requests, joblib, os
+import re, cv2, numpy as np, joblib, os
 from pathlib import Path
 
+from app.utils.clients import get_http_session
+
 __all__ = [
     # Main public API
     "classify_avatar_url",
+    "classify_avatar_bytes",
     "upgrade_avatar_url",
     "download_avatar",
+    "download_image_bytes",
+    "sniff_image_type",
     # Model loading
     "get_xgb_model",
     "get_pca_kmeans_model",
@@ -88,25 +93,72 @@ def score_with_pca_kmeans(metrics: dict) -> dict:
 
 
 # ───── Download Helpers ─────
+# '=s<number>-' size component of avatar URLs (group 2 = digits)
+_AVATAR_SIZE_RE = re.compile(r"(=s)(\d+)(-[^?]*)")
+
 def upgrade_avatar_url(url: str, size: int = 256) -> str:
     """
     Replace the *last* occurrence of '=s<number>-' with '=s<size>-' in the URL.
     Keeps any trailing suffixes like '-c-k-c0x00ffffff-no-rj'.
     """
-    match = list(re.finditer(r"(=s)(\d+)(-[^?]*)", url))
-    if not match:
+    last = None
+    for last in _AVATAR_SIZE_RE.finditer(url):
+        pass
+    if last is None:
         return url  # nothing to replace
 
-    last = match[-1]
     start, end = last.span(2)  # group(2) = digits
     return url[:start] + str(size) + url[end:]
 
 
 def download_avatar(url: str, timeout=5) -> np.ndarray | None:
     try:
-        resp = requests.get(url, timeout=timeout)
-        arr  = np.frombuffer(resp.content, dtype=np.uint8)
-        return cv2.imdecode(arr, cv2.IMREAD_COLOR)
+        resp = get_http_session().get(url, timeout=timeout)
+        return decode_avatar(resp.content)
+    except Exception:
+        return None
+
+# Image types kept as served, mapped to their file extension
+IMAGE_EXTENSIONS = {"image/jpeg": ".jpg", "image/png": ".png", "image/webp": ".webp"}
+
+def sniff_image_type(content: bytes | None) -> str | None:
+    """Identify an image from its magic bytes rather than the served header.
+
+    Returns the content type (a key of IMAGE_EXTENSIONS), or None when the
+    bytes are not a JPEG/PNG/WebP image.
+    """
+    if not content or len(content) < 100:
+        return None
+    if content.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if content.startswith(b"\x89PNG"):
+        return "image/png"
+    if content.startswith(b"RIFF") and content[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+def download_image_bytes(url: str, timeout=5) -> tuple[bytes | None, str | None]:
+    """Download an image without decoding it.
+
+    Returns (bytes, content_type), or (None, None) on failure or when the
+    body is not a JPEG/PNG/WebP image. The type is sniffed from the bytes,
+    so generic or misspelled Content-Type headers are not rejected.
+    """
+    try:
+        resp = get_http_session().get(url, timeout=timeout)
+    except Exception:
+        return None, None
+    content_type = sniff_image_type(resp.content) if resp.ok else None
+    if content_type is None:
+        return None, None
+    return resp.content, content_type
+
+def decode_avatar(content: bytes | None) -> np.ndarray | None:
+    """Decode downloaded image bytes into a BGR array (None if undecodable)."""
+    if not content:
+        return None
+    try:
+        return cv2.imdecode(np.frombuffer(content, dtype=np.uint8), cv2.IMREAD_COLOR)
     except Exception:
         return None
 
@@ -223,6 +275,11 @@ def _classify_avatar_url_traditional(url: str, size: int = 256, model=None) -> t
     img = download_avatar(hi)
     if img is None:
         img = download_avatar(url)
+    return _classify_avatar_image_traditional(img, model)
+
+
+def _classify_avatar_image_traditional(img: np.ndarray | None, model=None) -> tuple[str, dict]:
+    """Classify an already-decoded avatar using image metrics and heuristics."""
     if img is None:
         return "MISSING", {}
 
@@ -300,6 +357,58 @@ def classify_avatar_url(url: str, size: int = 256, model=None, use_mobilenet: bo
     return _classify_avatar_url_traditional(url, size, model)
 
 
+def _downscale(img: np.ndarray, max_size: int) -> np.ndarray:
+    """Shrink an image so its longer side is at most max_size (never upscales)."""
+    h, w = img.shape[:2]
+    if max(h, w) <= max_size:
+        return img
+    scale = max_size / max(h, w)
+    return cv2.resize(img, (max(1, round(w * scale)), max(1, round(h * scale))), interpolation=cv2.INTER_AREA)
+
+
+def classify_avatar_bytes(
+    contents: list[bytes | None],
+    model=None,
+    use_mobilenet: bool = True,
+    max_size: int | None = None,
+) -> list[tuple[str, dict]]:
+    """Classify many already-downloaded avatars at once.
+    
+    When MobileNet is available the decoded images are scored in a single
+    batched forward pass instead of one pass per avatar.
+    
+    Args:
+        contents: Raw image bytes (None entries are reported as MISSING)
+        model: XGBoost model (for traditional method)
+        use_mobilenet: Whether to use MobileNet if available (default True)
+        max_size: Downscale larger images to this size first, so metrics match
+            an avatar downloaded at that size
+        
+    Returns:
+        List of (label, metrics_dict), in input order
+    """
+    results: list[tuple[str, dict]] = [("MISSING", {})] * len(contents)
+    todo = [(i, img) for i, img in enumerate(map(decode_avatar, contents)) if img is not None]
+    if max_size:
+        todo = [(i, _downscale(img, max_size)) for i, img in todo]
+    if not todo:
+        return results
+
+    if use_mobilenet and is_mobilenet_available():
+        try:
+            from app.utils.mobilenet_classifier import classify_avatars_mobilenet
+            scored = classify_avatars_mobilenet([img for _, img in todo])
+            for (i, _img), (label, _prob, metrics) in zip(todo, scored):
+                results[i] = (label, metrics)
+            return results
+        except Exception as e:
+            print(f"⚠️ MobileNet batch classification failed ({e}), falling back to traditional method")
+
+    for i, img in todo:
+        results[i] = _classify_avatar_image_traditional(img, model)
+    return results
+
+
 if __name__ == "__main__":
     test_urls = [
         # Sus
@@ -1,9 +1,11 @@
+import atexit
 import json
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 from google.cloud import storage
 
+from app.utils.clients import get_gcs
 from app.utils.gcs_utils import read_json_from_gcs, write_json_to_gcs
 
 __all__ = ["ManifestManager"]
@@ -53,20 +55,43 @@ class ManifestManager:
         manager.mark_in_progress("file.json")
         # ... do work ...
         manager.mark_completed("file.json")
+    
+    The manifest is downloaded once and then kept in memory (with completed
+    paths indexed in a set), so marks only upload. This assumes a single
+    writer per manifest; call refresh() to pick up external changes.
+    
+    With save_every > 1, the manifest is uploaded every N completed files
+    instead of on each mark (in-progress marks ride along with the next
+    upload); call flush() (e.g. in a finally block) to persist the remainder.
+    Unsaved marks are also flushed at interpreter exit as a fallback.
     """
     
-    def __init__(self, bucket: str, manifest_path: str, storage_client: Optional[storage.Client] = None):
+    def __init__(
+        self,
+        bucket: str,
+        manifest_path: str,
+        storage_client: Optional[storage.Client] = None,
+        save_every: int = 1,
+    ):
         """Initialize the manifest manager.
         
         Args:
             bucket: GCS bucket name
             manifest_path: Path to manifest file in bucket
             storage_client: Optional pre-configured storage client (for testing/reuse)
+            save_every: Upload the manifest after this many completions (1 = every mark)
         """
         self.bucket = bucket
         self.manifest_path = manifest_path
-        self._storage_client = storage_client or storage.Client()
+        self._storage_client = storage_client or get_gcs()
         self._blob = self._storage_client.bucket(bucket).blob(manifest_path)
+        self._manifest: Optional[Dict] = None
+        self._completed: Set[str] = set()
+        self._save_every = max(1, save_every)
+        self._unsaved_marks = 0
+        self._dirty = False
+        if self._save_every > 1:
+            atexit.register(self._flush_at_exit)
         
     def load(self) -> Dict:
         """Load manifest from GCS or return default structure.
@@ -82,6 +107,22 @@ class ManifestManager:
             logger.warning(f"Failed to load manifest {self.manifest_path}: {e}")
             return {"completed": [], "in_progress": None, "last_run": None}
     
+    def refresh(self) -> Dict:
+        """Re-download the manifest and replace the in-memory copy.
+        
+        Returns:
+            Freshly loaded manifest dictionary
+        """
+        self._manifest = self.load()
+        self._completed = set(self._manifest.get("completed", []))
+        return self._manifest
+
+    def _state(self) -> Dict:
+        """Return the cached manifest, loading it from GCS on first use."""
+        if self._manifest is None:
+            return self.refresh()
+        return self._manifest
+    
     def save(self, manifest: Dict) -> None:
         """Save manifest to GCS with updated timestamp.
         
@@ -90,7 +131,37 @@ class ManifestManager:
         """
         manifest["last_run"] = datetime.now().isoformat(timespec="seconds") + "Z"
         self._blob.upload_from_string(json.dumps(manifest, ensure_ascii=False))
+        if manifest is not self._manifest:
+            self._manifest = manifest
+            self._completed = set(manifest.get("completed", []))
+        self._unsaved_marks = 0
+        self._dirty = False
         logger.debug(f"Saved manifest to {self.manifest_path}")
+
+    def _save_mark(self, completion: bool = True) -> None:
+        """Record a mark and upload once save_every completions have accumulated.
+        
+        Args:
+            completion: Whether the mark counts toward save_every; other marks
+                are only uploaded immediately when saving every mark
+        """
+        self._dirty = True
+        if completion:
+            self._unsaved_marks += 1
+        if self._save_every == 1 or self._unsaved_marks >= self._save_every:
+            self.save(self._state())
+
+    def flush(self) -> None:
+        """Upload any marks not yet saved."""
+        if self._dirty:
+            self.save(self._state())
+    
+    def _flush_at_exit(self) -> None:
+        """atexit hook: flush() without letting upload errors escape."""
+        try:
+            self.flush()
+        except Exception as e:
+            logger.warning(f"Failed to flush manifest {self.manifest_path} at exit: {e}")
     
     def is_completed(self, gcs_path: str) -> bool:
         """Check if a file has been marked as completed.
@@ -101,8 +172,8 @@ class ManifestManager:
         Returns:
             True if file is in completed list
         """
-        manifest = self.load()
-        return gcs_path in manifest.get("completed", [])
+        self._state()
+        return gcs_path in self._completed
     
     def is_in_progress(self, gcs_path: Optional[str] = None) -> bool:
         """Check if a file is currently in progress.
@@ -113,7 +184,7 @@ class ManifestManager:
         Returns:
             True if file (or any file) is marked as in progress
         """
-        manifest = self.load()
+        manifest = self._state()
         current_in_progress = manifest.get("in_progress")
         
         if gcs_path is None:
@@ -127,7 +198,7 @@ class ManifestManager:
         Returns:
             Path of file currently in progress, or None
         """
-        manifest = self.load()
+        manifest = self._state()
         return manifest.get("in_progress")
     
     def get_completed(self) -> List[str]:
@@ -136,8 +207,8 @@ class ManifestManager:
         Returns:
             List of completed file paths
         """
-        manifest = self.load()
-        return manifest.get("completed", [])
+        manifest = self._state()
+        return list(manifest.get("completed", []))
     
     def mark_in_progress(self, gcs_path: str) -> None:
         """Mark a file as currently being processed.
@@ -145,9 +216,9 @@ class ManifestManager:
         Args:
             gcs_path: Path to file being processed
         """
-        manifest = self.load()
+        manifest = self._state()
         manifest["in_progress"] = gcs_path
-        self.save(manifest)
+        self._save_mark(completion=False)
         logger.info(f"Marked {gcs_path} as in progress in {self.manifest_path}")
     
     def mark_completed(self, gcs_path: str) -> None:
@@ -156,18 +227,19 @@ class ManifestManager:
         Args:
             gcs_path: Path to completed file
         """
-        manifest = self.load()
+        manifest = self._state()
         
-        if gcs_path not in manifest.get("completed", []):
+        if gcs_path not in self._completed:
             manifest.setdefault("completed", []).append(gcs_path)
+            self._completed.add(gcs_path)
         
         manifest["in_progress"] = None
-        self.save(manifest)
+        self._save_mark()
         logger.info(f"Marked {gcs_path} as completed in {self.manifest_path}")
     
     def clear_in_progress(self) -> None:
         """Clear the in_progress field (useful for error recovery)."""
-        manifest = self.load()
+        manifest = self._state()
         manifest["in_progress"] = None
         self.save(manifest)
         logger.info(f"Cleared in_progress in {self.manifest_path}")
@@ -7,7 +7,7 @@ import logging
 import os
 import warnings
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 import io
 
 # Disable NNPACK warnings for CPU-only environments
@@ -17,12 +17,13 @@ warnings.filterwarnings('ignore', message='.*NNPACK.*')
 
 import cv2
 import numpy as np
-import requests
 import torch
 import torch.nn as nn
 from torchvision import models, transforms
 from PIL import Image
 
+from app.utils.clients import get_http_session
+
 LOGGER = logging.getLogger(__name__)
 
 _MODEL = None
@@ -136,6 +137,63 @@ def classify_avatar_mobilenet(
         return "UNKNOWN", 0.5, {"error": str(e)}
 
 
+def classify_avatars_mobilenet(
+    image_inputs: List,
+    model_path: str = "models/avatar/mobilenet_v2_best.pth"
+) -> List[Tuple[str, float, dict]]:
+    """Classify several avatar images with a single MobileNet forward pass.
+    
+    Images that fail to load get the same UNKNOWN result as
+    classify_avatar_mobilenet; the rest are stacked into one batch.
+    
+    Args:
+        image_inputs: URLs, file paths, PIL Images, or numpy arrays
+        model_path: Path to trained model
+        
+    Returns:
+        List of (label, bot_probability, metrics), in input order
+    """
+    results: List[Tuple[str, float, dict]] = [
+        ("UNKNOWN", 0.5, {"error": "Failed to load image"})
+    ] * len(image_inputs)
+    try:
+        model = load_mobilenet_model(model_path)
+        device = get_device()
+        transform = get_image_transform()
+        
+        indices, tensors = [], []
+        for i, image_input in enumerate(image_inputs):
+            img = _load_image(image_input)
+            if img is None:
+                continue
+            indices.append(i)
+            tensors.append(transform(img.convert("RGB")))
+        
+        if not tensors:
+            return results
+        
+        with torch.no_grad():
+            output = model(torch.stack(tensors).to(device))
+            probabilities = torch.softmax(output, dim=1).cpu().tolist()
+        
+        for i, (bot_prob, human_prob) in zip(indices, probabilities):
+            results[i] = (
+                "BOT" if bot_prob > 0.5 else "HUMAN",
+                bot_prob,
+                {
+                    "bot_probability": bot_prob,
+                    "human_probability": human_prob,
+                    "confidence": max(bot_prob, human_prob),
+                    "model": "mobilenet_v2",
+                },
+            )
+        return results
+        
+    except Exception as e:
+        LOGGER.error(f"MobileNet batch classification failed: {e}")
+        return [("UNKNOWN", 0.5, {"error": str(e)})] * len(image_inputs)
+
+
 def _load_image(image_input) -> Optional[Image.Image]:
     """Load image from various input types."""
     try:
@@ -148,7 +206,7 @@ def _load_image(image_input) -> Optional[Image.Image]:
             return Image.fromarray(image_input)
         
         if isinstance(image_input, str) and image_input.startswith(('http://', 'https://')):
-            response = requests.get(image_input, timeout=10)
+            response = get_http_session().get(image_input, timeout=10)
             response.raise_for_status()
             return Image.open(io.BytesIO(response.content))
         
@@ -21,10 +21,19 @@ LIKE_THRESHOLD = 10
 MAX_CONSECUTIVE_LOW_LIKE_PAGES = 2
 
 
+def _top_comment_likes(item: dict) -> int:
+    """Return the top-level comment's like count (0 if missing)."""
+    try:
+        return item["snippet"]["topLevelComment"]["snippet"].get("likeCount", 0)
+    except (KeyError, TypeError):
+        return 0
+
+
 def fetch_comment_threads_by_video_id(
     video_id: str,
     dry_run: bool = False,
-    max_api_calls: Optional[int] = None
+    max_api_calls: Optional[int] = None,
+    youtube=None
 ) -> Optional[str]:
     """Fetch comment threads for a video with intelligent early stopping.
     
@@ -35,11 +44,13 @@ def fetch_comment_threads_by_video_id(
         video_id: YouTube video ID
         dry_run: If True, don't save to GCS
         max_api_calls: Maximum number of API calls to make (for testing)
+        youtube: YouTube API client to use (defaults to the shared client;
+            pass a per-thread client when calling from a thread pool)
         
     Returns:
         GCS path of saved file, or None if already processed or dry run
     """
-    youtube = get_youtube()
+    youtube = youtube or get_youtube()
     manifest_path = video_comments_seen_path(video_id)
 
     if not dry_run and file_exists_in_gcs(GCS_BUCKET_DATA, manifest_path):
@@ -77,13 +88,7 @@ def fetch_comment_threads_by_video_id(
             all_items.extend(items)
 
             # Check for like threshold
-            has_high_like = any(
-                item.get("snippet", {})
-                    .get("topLevelComment", {})
-                    .get("snippet", {})
-                    .get("likeCount", 0) >= LIKE_THRESHOLD
-                for item in items
-            )
+            has_high_like = any(_top_comment_likes(item) >= LIKE_THRESHOLD for item in items)
 
             if not has_high_like:
                 consecutive_low_like_pages += 1
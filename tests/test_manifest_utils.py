@@ -0,0 +1,111 @@
+"""Tests for ManifestManager's batched manifest uploads."""
+
+import json
+
+import app.utils.clients as clients
+
+
+class _FakeBlob:
+    """In-memory stand-in for a GCS blob that counts uploads."""
+
+    def __init__(self):
+        self.data = None
+        self.uploads = 0
+
+    def exists(self):
+        return self.data is not None
+
+    def download_as_bytes(self):
+        return self.data
+
+    def upload_from_string(self, data, **kwargs):
+        self.data = data.encode("utf-8") if isinstance(data, str) else data
+        self.uploads += 1
+
+
+class _FakeStorageClient:
+    """Storage client whose buckets all hand out the same blob."""
+
+    def __init__(self, blob):
+        self._blob = blob
+
+    def bucket(self, name):
+        return self
+
+    def blob(self, path):
+        return self._blob
+
+
+# gcs_utils builds its client at import time; keep that off real credentials
+if clients._gcs is None:
+    clients._gcs = _FakeStorageClient(_FakeBlob())
+
+from app.utils.manifest_utils import ManifestManager  # noqa: E402
+
+
+def _manager(save_every):
+    blob = _FakeBlob()
+    manager = ManifestManager(
+        bucket="bucket",
+        manifest_path="manifests/test/manifest.json",
+        storage_client=_FakeStorageClient(blob),
+        save_every=save_every,
+    )
+    return manager, blob
+
+
+def _saved(blob):
+    return json.loads(blob.data)
+
+
+def test_in_progress_marks_do_not_upload():
+    manager, blob = _manager(save_every=3)
+    for i in range(5):
+        manager.mark_in_progress(f"file{i}.json")
+    assert blob.uploads == 0
+
+
+def test_uploads_every_n_completions():
+    manager, blob = _manager(save_every=3)
+    for i in range(7):
+        manager.mark_in_progress(f"file{i}.json")
+        manager.mark_completed(f"file{i}.json")
+        assert blob.uploads == (i + 1) // 3
+    assert _saved(blob)["completed"] == [f"file{i}.json" for i in range(6)]
+
+
+def test_flush_persists_remainder():
+    manager, blob = _manager(save_every=3)
+    for i in range(4):
+        manager.mark_in_progress(f"file{i}.json")
+        manager.mark_completed(f"file{i}.json")
+    manager.mark_in_progress("file4.json")
+    assert blob.uploads == 1
+
+    manager.flush()
+    assert blob.uploads == 2
+    saved = _saved(blob)
+    assert saved["completed"] == [f"file{i}.json" for i in range(4)]
+    assert saved["in_progress"] == "file4.json"
+
+
+def test_flush_is_noop_when_clean():
+    manager, blob = _manager(save_every=3)
+    manager.flush()
+    assert blob.uploads == 0
+
+    for i in range(3):
+        manager.mark_completed(f"file{i}.json")
+    assert blob.uploads == 1
+    manager.flush()
+    assert blob.uploads == 1
+
+
+def test_save_every_one_uploads_each_mark():
+    manager, blob = _manager(save_every=1)
+    manager.mark_in_progress("file0.json")
+    assert blob.uploads == 1
+    assert _saved(blob)["in_progress"] == "file0.json"
+    manager.mark_completed("file0.json")
+    assert blob.uploads == 2
+    assert _saved(blob)["in_progress"] is None
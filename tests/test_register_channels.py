@@ -0,0 +1,83 @@
+"""Tests for the streaming commentThreads parser in register_channels."""
+
+import io
+import json
+
+import app.utils.clients as clients
+
+# Importing the pipeline builds GCS/Firestore clients at module level; the
+# parser under test never touches them, so keep them off real credentials
+if clients._gcs is None:
+    clients._gcs = object()
+if clients._firestore is None:
+    clients._firestore = object()
+
+from app.pipeline.comments.register_channels import _iter_commenters  # noqa: E402
+
+
+def _thread(author_id=None, likes=None, avatar_url=None, replies=None):
+    snippet = {"textDisplay": "hello"}
+    if author_id is not None:
+        snippet["authorChannelId"] = {"value": author_id}
+    if likes is not None:
+        snippet["likeCount"] = likes
+    if avatar_url is not None:
+        snippet["authorProfileImageUrl"] = avatar_url
+    thread = {}
+    if replies is not None:
+        # Replies come first so their fields are parsed before the top-level ones
+        thread["replies"] = {"comments": [
+            {"snippet": {
+                "authorChannelId": {"value": cid},
+                "likeCount": reply_likes,
+                "authorProfileImageUrl": f"https://yt3.example/{cid}",
+            }}
+            for cid, reply_likes in replies
+        ]}
+    thread["snippet"] = {"topLevelComment": {"snippet": snippet}}
+    return thread
+
+
+def _parse(items):
+    payload = json.dumps({"kind": "youtube#commentThreadListResponse", "items": items})
+    return list(_iter_commenters(io.BytesIO(payload.encode("utf-8"))))
+
+
+def test_replies_do_not_leak_into_top_level():
+    result = _parse([
+        _thread("UCtop", 12, "https://yt3.example/top", replies=[("UCreply", 999)]),
+        _thread("UCnext", 3, "https://yt3.example/next", replies=[("UCother", 50)]),
+    ])
+    assert result == [
+        ("UCtop", 12, "https://yt3.example/top"),
+        ("UCnext", 3, "https://yt3.example/next"),
+    ]
+
+
+def test_missing_author_channel_id():
+    result = _parse([
+        _thread(None, 5, "https://yt3.example/anon"),
+        _thread("UCafter", 1, None),
+    ])
+    assert result == [
+        (None, 5, "https://yt3.example/anon"),
+        ("UCafter", 1, None),
+    ]
+
+
+def test_missing_like_count_defaults_to_zero():
+    result = _parse([
+        _thread("UCliked", 40, None),
+        _thread("UCunliked", None, None),
+    ])
+    assert result == [("UCliked", 40, None), ("UCunliked", 0, None)]
+
+
+def test_float_like_counts_become_ints():
+    result = _parse([_thread("UCfloat", 7.0, None), _thread("UCbig", 1.2e3, None)])
+    assert result == [("UCfloat", 7, None), ("UCbig", 1200, None)]
+    assert all(type(likes) is int for _, likes, _ in result)
+
+
+def test_empty_items():
+    assert _parse([]) == []